@@ -0,0 +1,177 @@
+import asyncio
+import contextlib
+import itertools
+import json
+import logging
+from collections.abc import AsyncIterator
+from http import HTTPStatus
+
+import books_pb2
+import books_pb2_grpc
+import grpc
+from common import (
+    CALL_TIMEOUT,
+    CHANNEL_OPTIONS,
+    GRPC_SERVER,
+    POOL_SIZE,
+    STREAM_TIMEOUT,
+    batches,
+    book_to_dict,
+    http_status,
+)
+from fastapi import FastAPI, Query
+from fastapi.responses import JSONResponse, StreamingResponse
+
+logger = logging.getLogger(__name__)
+
+
+class AioChannelPool:
+    """
+    Long-lived grpc.aio channels to the gRPC server, shared by all the
+    requests of the event loop.
+
+    The channels connect in the background and reconnect on their own, their
+    connectivity is only tracked to report the readiness of the gateway.
+    """
+
+    def __init__(self, target: str, size: int):
+        self.__channels = [
+            grpc.aio.insecure_channel(target, options=CHANNEL_OPTIONS)
+            for _ in range(max(size, 1))
+        ]
+        self.__stubs = itertools.cycle(
+            [books_pb2_grpc.BookServiceStub(c) for c in self.__channels]
+        )
+        self.__trackers = [
+            asyncio.create_task(self._track(channel))
+            for channel in self.__channels
+        ]
+
+    async def _track(self, channel: grpc.aio.Channel) -> None:
+        state = channel.get_state(try_to_connect=True)
+        while True:
+            logger.info("gRPC channel %s", state.name)
+            await channel.wait_for_state_change(state)
+            state = channel.get_state(try_to_connect=True)
+
+    def stub(self) -> books_pb2_grpc.BookServiceStub:
+        return next(self.__stubs)
+
+    def is_ready(self) -> bool:
+        return any(
+            channel.get_state() == grpc.ChannelConnectivity.READY
+            for channel in self.__channels
+        )
+
+    async def close(self) -> None:
+        for tracker in self.__trackers:
+            tracker.cancel()
+        await asyncio.gather(*self.__trackers, return_exceptions=True)
+        await asyncio.gather(*(channel.close() for channel in self.__channels))
+
+
+channel_pool: AioChannelPool | None = None
+
+
+@contextlib.asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    global channel_pool
+    channel_pool = AioChannelPool(GRPC_SERVER, POOL_SIZE)
+    yield
+    await channel_pool.close()
+
+
+app = FastAPI(lifespan=lifespan)
+
+
+def error_response(error: grpc.aio.AioRpcError) -> JSONResponse:
+    return JSONResponse(
+        {"error": error.details()}, status_code=http_status(error.code())
+    )
+
+
+@app.get("/health")
+async def health() -> JSONResponse:
+    if channel_pool.is_ready():
+        return JSONResponse({"status": "ok"})
+    return JSONResponse(
+        {"status": "gRPC server is not connected"},
+        status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+    )
+
+
+@app.get("/books/{book_uuid}")
+async def get_book(book_uuid: str) -> JSONResponse:
+    try:
+        response = await channel_pool.stub().GetBookById(
+            books_pb2.BookIdRequest(uuid=book_uuid), timeout=CALL_TIMEOUT
+        )
+    except grpc.aio.AioRpcError as e:
+        return error_response(e)
+    return JSONResponse(book_to_dict(response))
+
+
+@app.get("/books", response_model=None)
+async def get_all_books(
+    uuid: list[str] = Query(default_factory=list),
+) -> JSONResponse | StreamingResponse:
+    """
+    Get all the books, or the ones with the `uuid` query parameters, in
+    their order.
+
+    All the books are streamed to the client as a chunked JSON array while
+    they are received from the server.
+    """
+    if uuid:
+        return await batch_get_books(uuid)
+    call = channel_pool.stub().ListBooks(
+        books_pb2.ListBooksRequest(), timeout=STREAM_TIMEOUT
+    )
+    try:
+        # Wait for the first book, so that a failed call gets its status
+        book = await call.read()
+    except grpc.aio.AioRpcError as e:
+        return error_response(e)
+    return StreamingResponse(
+        stream_books(call, book), media_type="application/json"
+    )
+
+
+async def batch_get_books(uuids: list[str]) -> JSONResponse:
+    try:
+        responses = await asyncio.gather(
+            *(
+                channel_pool.stub().BatchGetBooks(
+                    books_pb2.BatchGetBooksRequest(uuids=batch),
+                    timeout=CALL_TIMEOUT,
+                )
+                for batch in batches(uuids)
+            )
+        )
+    except grpc.aio.AioRpcError as e:
+        return error_response(e)
+    return JSONResponse(
+        [
+            book_to_dict(book)
+            for response in responses
+            for book in response.books
+        ]
+    )
+
+
+async def stream_books(
+    call: grpc.aio.UnaryStreamCall, book: books_pb2.BookResponse
+) -> AsyncIterator[bytes]:
+    """
+    A failure in the middle of the stream aborts the response, leaving the
+    array unterminated.
+    """
+    try:
+        separator = b"["
+        while book is not grpc.aio.EOF:
+            yield separator + json.dumps(book_to_dict(book)).encode()
+            separator = b","
+            book = await call.read()
+        yield b"[]" if separator == b"[" else b"]"
+    finally:
+        call.cancel()
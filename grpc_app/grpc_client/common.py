@@ -0,0 +1,80 @@
+import json
+import os
+from http import HTTPStatus
+
+import grpc
+from books_pb2 import BookResponse
+from dotenv import load_dotenv
+
+load_dotenv(".env")
+
+GRPC_SERVER = (
+    f"{os.environ.get('GRPC_SERVER_HOST')}:{os.environ.get('GRPC_SERVER_PORT')}"
+)
+# Channels opened at startup and used in turn, one is usually enough as
+# a channel multiplexes the calls over HTTP/2
+POOL_SIZE = int(os.environ.get("GRPC_CLIENT_POOL_SIZE", 1))
+# Deadlines of the unary and the streaming calls, in seconds
+CALL_TIMEOUT = float(os.environ.get("GRPC_CLIENT_CALL_TIMEOUT", 5))
+STREAM_TIMEOUT = float(os.environ.get("GRPC_CLIENT_STREAM_TIMEOUT", 60))
+KEEPALIVE_TIME_MS = int(os.environ.get("GRPC_CLIENT_KEEPALIVE_TIME_MS", 30000))
+# UUIDs per BatchGetBooks call, the larger requests are split into
+# concurrent calls
+BATCH_SIZE = int(os.environ.get("GRPC_CLIENT_BATCH_SIZE", 100))
+
+# Calls failed with UNAVAILABLE, e.g. while the server restarts, are retried
+# by the channel itself with a backoff
+SERVICE_CONFIG = {
+    "methodConfig": [
+        {
+            "name": [{"service": "books.BookService"}],
+            "retryPolicy": {
+                "maxAttempts": 4,
+                "initialBackoff": "0.1s",
+                "maxBackoff": "2s",
+                "backoffMultiplier": 2,
+                "retryableStatusCodes": ["UNAVAILABLE"],
+            },
+        }
+    ]
+}
+
+CHANNEL_OPTIONS = [
+    ("grpc.enable_retries", 1),
+    ("grpc.service_config", json.dumps(SERVICE_CONFIG)),
+    ("grpc.keepalive_time_ms", KEEPALIVE_TIME_MS),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+]
+
+HTTP_STATUSES = {
+    grpc.StatusCode.INVALID_ARGUMENT: HTTPStatus.BAD_REQUEST,
+    grpc.StatusCode.UNAUTHENTICATED: HTTPStatus.UNAUTHORIZED,
+    grpc.StatusCode.PERMISSION_DENIED: HTTPStatus.FORBIDDEN,
+    grpc.StatusCode.NOT_FOUND: HTTPStatus.NOT_FOUND,
+    grpc.StatusCode.RESOURCE_EXHAUSTED: HTTPStatus.TOO_MANY_REQUESTS,
+    grpc.StatusCode.UNIMPLEMENTED: HTTPStatus.NOT_IMPLEMENTED,
+    grpc.StatusCode.UNAVAILABLE: HTTPStatus.SERVICE_UNAVAILABLE,
+    grpc.StatusCode.DEADLINE_EXCEEDED: HTTPStatus.GATEWAY_TIMEOUT,
+}
+
+
+def http_status(code: grpc.StatusCode) -> HTTPStatus:
+    return HTTP_STATUSES.get(code, HTTPStatus.INTERNAL_SERVER_ERROR)
+
+
+def book_to_dict(book: BookResponse) -> dict[str, str]:
+    return {
+        "uuid": book.uuid,
+        "title": book.title,
+        "author": book.author,
+        "published_date": book.published_date,
+    }
+
+
+def batches(uuids: list[str]) -> list[list[str]]:
+    return [
+        uuids[start : start + BATCH_SIZE]
+        for start in range(0, len(uuids), BATCH_SIZE)
+    ]
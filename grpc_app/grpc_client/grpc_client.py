@@ -1,68 +1,135 @@
-import os
-import time
+import atexit
+import itertools
+import logging
+import threading
 
 import books_pb2
 import books_pb2_grpc
 import grpc
-from dotenv import load_dotenv
-from flask import Flask, jsonify
+from common import (
+    CALL_TIMEOUT,
+    CHANNEL_OPTIONS,
+    GRPC_SERVER,
+    POOL_SIZE,
+    STREAM_TIMEOUT,
+    batches,
+    book_to_dict,
+    http_status,
+)
+from flask import Flask, jsonify, request
 
-load_dotenv(".env")
+logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 
 
-def get_grpc_client():
-    retries = 5
-    while retries > 0:
-        try:
-            channel = grpc.insecure_channel(
-                f'{os.environ.get("GRPC_SERVER_HOST")}:{os.environ.get("GRPC_SERVER_PORT")}'
+class ChannelPool:
+    """
+    Long-lived channels to the gRPC server, shared by all the requests.
+
+    The channels connect in the background and reconnect on their own, their
+    connectivity is only tracked to report the readiness of the gateway.
+    """
+
+    def __init__(self, target: str, size: int):
+        self.__channels = [
+            grpc.insecure_channel(target, options=CHANNEL_OPTIONS)
+            for _ in range(max(size, 1))
+        ]
+        self.__stubs = itertools.cycle(
+            [books_pb2_grpc.BookServiceStub(c) for c in self.__channels]
+        )
+        self.__lock = threading.Lock()
+        self.__states = {}
+        for channel in self.__channels:
+            channel.subscribe(
+                lambda state, channel=channel: self._track(channel, state),
+                try_to_connect=True,
             )
-            grpc.channel_ready_future(channel).result(timeout=10)
-            client = books_pb2_grpc.BookServiceStub(channel)
-            return client
-        except grpc.FutureTimeoutError:
-            retries -= 1
-            print(f"gRPC server not ready, retrying... ({5 - retries}/5)")
-            time.sleep(2)
+
+    def _track(self, channel: grpc.Channel, state: grpc.ChannelConnectivity):
+        if self.__states.get(channel) != state:
+            logger.info("gRPC channel %s", state.name)
+        self.__states[channel] = state
+
+    def stub(self) -> books_pb2_grpc.BookServiceStub:
+        with self.__lock:
+            return next(self.__stubs)
+
+    def is_ready(self) -> bool:
+        return any(
+            state == grpc.ChannelConnectivity.READY
+            for state in self.__states.values()
+        )
+
+    def close(self) -> None:
+        for channel in self.__channels:
+            channel.close()
+
+
+channel_pool = ChannelPool(GRPC_SERVER, POOL_SIZE)
+atexit.register(channel_pool.close)
+
+
+def get_grpc_client() -> books_pb2_grpc.BookServiceStub:
+    return channel_pool.stub()
+
+
+@app.route("/health", methods=["GET"])
+def health():
+    if channel_pool.is_ready():
+        return jsonify({"status": "ok"})
+    return jsonify({"status": "gRPC server is not connected"}), 503
 
 
 @app.route("/books/<book_uuid>", methods=["GET"])
 def get_book(book_uuid):
     try:
         client = get_grpc_client()
-        response = client.GetBookById(books_pb2.BookIdRequest(uuid=book_uuid))
-        return jsonify(
-            {
-                "uuid": response.uuid,
-                "title": response.title,
-                "author": response.author,
-                "published_date": response.published_date,
-            }
+        response = client.GetBookById(
+            books_pb2.BookIdRequest(uuid=book_uuid), timeout=CALL_TIMEOUT
         )
+        return jsonify(book_to_dict(response))
     except grpc.RpcError as e:
-        return jsonify({"error": e.details()}), e.code().value[0]
+        return jsonify({"error": e.details()}), http_status(e.code())
 
 
 @app.route("/books", methods=["GET"])
 def get_all_books():
+    """
+    Get all the books, or the ones with the `uuid` query parameters, in
+    their order.
+    """
     try:
+        uuids = request.args.getlist("uuid")
+        if uuids:
+            # The batches are requested at once and awaited together
+            calls = [
+                get_grpc_client().BatchGetBooks.future(
+                    books_pb2.BatchGetBooksRequest(uuids=batch),
+                    timeout=CALL_TIMEOUT,
+                )
+                for batch in batches(uuids)
+            ]
+            return jsonify(
+                [
+                    book_to_dict(book)
+                    for call in calls
+                    for book in call.result().books
+                ]
+            )
         client = get_grpc_client()
-        response = client.GetAllBooks(books_pb2.Empty())
-        books = [
-            {
-                "uuid": book.uuid,
-                "title": book.title,
-                "author": book.author,
-                "published_date": book.published_date,
-            }
-            for book in response.books
-        ]
-        return jsonify(books)
+        response = client.ListBooks(
+            books_pb2.ListBooksRequest(), timeout=STREAM_TIMEOUT
+        )
+        return jsonify([book_to_dict(book) for book in response])
     except grpc.RpcError as e:
-        return jsonify({"error": e.details()}), e.code().value[0]
+        return jsonify({"error": e.details()}), http_status(e.code())
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s - %(name)s - %(message)s",
+    )
     app.run(host="0.0.0.0", port=5000)
@@ -0,0 +1,29 @@
+import logging
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv(".env")
+
+# "sync" serves the gateway with Flask, a thread per in-flight request,
+# "asyncio" with uvicorn, many concurrent requests per worker process
+GATEWAY_MODE = os.environ.get("GRPC_GATEWAY_MODE", "sync")
+GATEWAY_WORKERS = int(os.environ.get("GRPC_GATEWAY_WORKERS", 1))
+HOST = "0.0.0.0"
+PORT = 5000
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s - %(name)s - %(message)s",
+    )
+    if GATEWAY_MODE == "asyncio":
+        import uvicorn
+
+        uvicorn.run(
+            "aio_gateway:app", host=HOST, port=PORT, workers=GATEWAY_WORKERS
+        )
+    else:
+        from grpc_client import app
+
+        app.run(host=HOST, port=PORT)
@@ -48,6 +48,24 @@ class BookServiceStub:
             response_deserializer=books__pb2.BooksListResponse.FromString,
             _registered_method=True,
         )
+        self.ListBooks = channel.unary_stream(
+            "/books.BookService/ListBooks",
+            request_serializer=books__pb2.ListBooksRequest.SerializeToString,
+            response_deserializer=books__pb2.BookResponse.FromString,
+            _registered_method=True,
+        )
+        self.ListBooksPage = channel.unary_unary(
+            "/books.BookService/ListBooksPage",
+            request_serializer=books__pb2.ListBooksRequest.SerializeToString,
+            response_deserializer=books__pb2.ListBooksPageResponse.FromString,
+            _registered_method=True,
+        )
+        self.BatchGetBooks = channel.unary_unary(
+            "/books.BookService/BatchGetBooks",
+            request_serializer=books__pb2.BatchGetBooksRequest.SerializeToString,
+            response_deserializer=books__pb2.BooksListResponse.FromString,
+            _registered_method=True,
+        )
 
 
 class BookServiceServicer:
@@ -60,7 +78,29 @@ class BookServiceServicer:
         raise NotImplementedError("Method not implemented!")
 
     def GetAllBooks(self, request, context):
-        """Missing associated documentation comment in .proto file."""
+        """Deprecated: loads the whole catalog into one message, use ListBooks"""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def ListBooks(self, request, context):
+        """Streams the books in the (created_at, uuid) order from a server-side
+        cursor, starting after `page_token` when it is set
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def ListBooksPage(self, request, context):
+        """Returns one page of the books in the same order"""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def BatchGetBooks(self, request, context):
+        """Returns the books with the given UUIDs in the order of the UUIDs,
+        skipping the missing ones, with a single query
+        """
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
@@ -78,6 +118,21 @@ def add_BookServiceServicer_to_server(servicer, server):
             request_deserializer=books__pb2.Empty.FromString,
             response_serializer=books__pb2.BooksListResponse.SerializeToString,
         ),
+        "ListBooks": grpc.unary_stream_rpc_method_handler(
+            servicer.ListBooks,
+            request_deserializer=books__pb2.ListBooksRequest.FromString,
+            response_serializer=books__pb2.BookResponse.SerializeToString,
+        ),
+        "ListBooksPage": grpc.unary_unary_rpc_method_handler(
+            servicer.ListBooksPage,
+            request_deserializer=books__pb2.ListBooksRequest.FromString,
+            response_serializer=books__pb2.ListBooksPageResponse.SerializeToString,
+        ),
+        "BatchGetBooks": grpc.unary_unary_rpc_method_handler(
+            servicer.BatchGetBooks,
+            request_deserializer=books__pb2.BatchGetBooksRequest.FromString,
+            response_serializer=books__pb2.BooksListResponse.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
         "books.BookService", rpc_method_handlers
@@ -151,3 +206,93 @@ class BookService:
             metadata,
             _registered_method=True,
         )
+
+    @staticmethod
+    def ListBooks(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/books.BookService/ListBooks",
+            books__pb2.ListBooksRequest.SerializeToString,
+            books__pb2.BookResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def ListBooksPage(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/books.BookService/ListBooksPage",
+            books__pb2.ListBooksRequest.SerializeToString,
+            books__pb2.ListBooksPageResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def BatchGetBooks(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/books.BookService/BatchGetBooks",
+            books__pb2.BatchGetBooksRequest.SerializeToString,
+            books__pb2.BooksListResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
@@ -29,26 +29,45 @@ DATABASE_URL = (
 )
 
 
+def _flag(name: str, default: bool) -> bool:
+    return os.environ.get(name, str(default)).lower() in ("1", "true", "yes")
+
+
+ENGINE_OPTIONS = {
+    "echo": _flag("POSTGRES_ECHO", False),
+    "pool_size": int(os.environ.get("POSTGRES_POOL_SIZE", 10)),
+    "max_overflow": int(os.environ.get("POSTGRES_MAX_OVERFLOW", 10)),
+    "pool_timeout": float(os.environ.get("POSTGRES_POOL_TIMEOUT", 30)),
+    "pool_pre_ping": _flag("POSTGRES_POOL_PRE_PING", True),
+    "pool_recycle": int(os.environ.get("POSTGRES_POOL_RECYCLE", 1800)),
+}
+
+
 class PostgresDatabase:
+    """
+    The engine of the server, created once and shared by all the RPCs.
+    """
+
     def __init__(self) -> None:
-        self._async_session_factory = async_sessionmaker(
-            create_async_engine(DATABASE_URL, echo=True)
-        )
+        self._engine = create_async_engine(DATABASE_URL, **ENGINE_OPTIONS)
+        self._async_session_factory = async_sessionmaker(self._engine)
 
     @asynccontextmanager
     async def get_session(self) -> AsyncIterator[AsyncSession]:
         try:
             session = self._async_session_factory()
-            logger.info("==> Session open")
+            logger.debug("==> Session open")
             yield session
-        except Exception as error:
-            logger.error("==> Session rollback because of exception", error)
+        except Exception:
+            logger.exception("==> Session rollback because of exception")
             await session.rollback()
             raise
         finally:
-            logger.info("==> Session close")
+            logger.debug("==> Session close")
             await session.close()
 
-
-def get_db():
-    return PostgresDatabase()
+    async def close(self) -> None:
+        """
+        Close the pooled connections.
+        """
+        await self._engine.dispose()
@@ -1,78 +1,401 @@
+import asyncio
+import base64
 import logging
+import multiprocessing
 import os
-from concurrent import futures
+import signal
+import socket
+import time
+import uuid
+from datetime import datetime
+from multiprocessing.connection import wait
 
 import books_pb2_grpc
 import grpc
-from books_pb2 import BookResponse, BooksListResponse
-from database import get_db
+from books_pb2 import BookResponse, BooksListResponse, ListBooksPageResponse
+from database import PostgresDatabase
 from dotenv import load_dotenv
-from faststream.rabbit import RabbitBroker
+from events_pb2 import BookEvent
+from faststream.rabbit import (
+    ExchangeType,
+    RabbitBroker,
+    RabbitExchange,
+    RabbitQueue,
+)
+from google.protobuf.field_mask_pb2 import FieldMask
+from google.protobuf.message import DecodeError
+from google.protobuf.timestamp_pb2 import Timestamp
 from models import Book
+from sqlalchemy import Select, any_, literal, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.future import select
+from sqlalchemy.orm import load_only
 
 load_dotenv(".env")
 
+logger = logging.getLogger(__name__)
 
 rabbit_user = os.environ.get("RABBITMQ_USER")
 rabbit_pass = os.environ.get("RABBITMQ_PASS")
 rabbit_host = os.environ.get("RABBITMQ_HOST")
 rabbit_port = os.environ.get("RABBITMQ_PORT")
+events_exchange = os.environ.get("RABBITMQ_EVENTS_EXCHANGE", "book_events")
+consumer_prefetch = int(os.environ.get("RABBITMQ_CONSUMER_PREFETCH", 50))
 
 broker = RabbitBroker(
-    f"amqp://{rabbit_user}:{rabbit_pass}@{rabbit_host}:{rabbit_port}/"
+    f"amqp://{rabbit_user}:{rabbit_pass}@{rabbit_host}:{rabbit_port}/",
+    max_consumers=consumer_prefetch,
+)
+
+book_events = RabbitExchange(
+    events_exchange, type=ExchangeType.FANOUT, durable=True
+)
+
+
+PORT = int(os.environ.get("GRPC_SERVER_PORT", 50051))
+# Server processes sharing the port with SO_REUSEPORT, each with its own
+# event loop, database pool and event queue
+WORKERS = int(os.environ.get("GRPC_WORKERS", 1))
+# Seconds the in-flight RPCs are given to complete on shutdown
+SHUTDOWN_GRACE = float(os.environ.get("GRPC_SHUTDOWN_GRACE", 5))
+MAX_CONCURRENT_STREAMS = int(os.environ.get("GRPC_MAX_CONCURRENT_STREAMS", 100))
+MAX_MESSAGE_LENGTH = int(
+    os.environ.get("GRPC_MAX_MESSAGE_LENGTH", 4 * 1024 * 1024)
 )
+# Compression of the responses: none, gzip or deflate
+COMPRESSION = {
+    "none": grpc.Compression.NoCompression,
+    "gzip": grpc.Compression.Gzip,
+    "deflate": grpc.Compression.Deflate,
+}[os.environ.get("GRPC_COMPRESSION", "none")]
+KEEPALIVE_TIME_MS = int(os.environ.get("GRPC_KEEPALIVE_TIME_MS", 60000))
+KEEPALIVE_TIMEOUT_MS = int(os.environ.get("GRPC_KEEPALIVE_TIMEOUT_MS", 20000))
+# Seconds before a worker that exited is restarted
+RESTART_DELAY = 1
+# Rows fetched from the cursor at a time by ListBooks
+STREAM_BATCH_SIZE = int(os.environ.get("GRPC_STREAM_BATCH_SIZE", 100))
+DEFAULT_PAGE_SIZE = int(os.environ.get("GRPC_DEFAULT_PAGE_SIZE", 50))
+MAX_PAGE_SIZE = int(os.environ.get("GRPC_MAX_PAGE_SIZE", 1000))
+
+
+def timestamp(value: datetime | None) -> Timestamp | None:
+    if value is None:
+        return None
+    result = Timestamp()
+    result.FromDatetime(value)
+    return result
+
+
+# Encoders of the BookResponse fields and the columns they are read from
+BOOK_FIELDS = {
+    "uuid": (lambda book: str(book.uuid), Book.uuid),
+    "title": (lambda book: book.title, Book.title),
+    "author": (lambda book: book.author, Book.author),
+    "published_date": (
+        lambda book: book.published_date and book.published_date.isoformat(),
+        Book.published_date,
+    ),
+    "published_at": (
+        lambda book: timestamp(book.published_date),
+        Book.published_date,
+    ),
+    "created_at": (lambda book: timestamp(book.created_at), Book.created_at),
+    "updated_at": (lambda book: timestamp(book.updated_at), Book.updated_at),
+}
+ALL_FIELDS = tuple(BOOK_FIELDS)
+
+
+def read_fields(read_mask: FieldMask) -> tuple[str, ...]:
+    """
+    Get the fields to return, all of them for an empty mask.
+
+    Raises:
+        ValueError: The mask has an unknown field.
+    """
+    if not read_mask.paths:
+        return ALL_FIELDS
+    unknown = set(read_mask.paths) - BOOK_FIELDS.keys()
+    if unknown:
+        raise ValueError(f"Unknown read_mask fields: {sorted(unknown)}")
+    return tuple(dict.fromkeys(read_mask.paths))
+
+
+def load_fields(*fields: str):
+    """
+    Load only the columns of the fields, and the primary key.
+    """
+    return load_only(*{BOOK_FIELDS[field][1] for field in fields})
+
+
+def book_response(
+    book: Book, fields: tuple[str, ...] = ALL_FIELDS
+) -> BookResponse:
+    return BookResponse(
+        **{field: BOOK_FIELDS[field][0](book) for field in fields}
+    )
+
+
+def encode_page_token(book: Book) -> str:
+    """
+    Encode the position after the book in the (created_at, uuid) order.
+    """
+    position = f"{book.created_at.isoformat()}|{book.uuid}"
+    return base64.urlsafe_b64encode(position.encode()).decode()
+
+
+def decode_page_token(page_token: str) -> tuple[datetime, uuid.UUID]:
+    """
+    Raises:
+        ValueError: The token is malformed.
+    """
+    position = base64.urlsafe_b64decode(page_token.encode()).decode()
+    created_at, book_uuid = position.split("|")
+    return datetime.fromisoformat(created_at), uuid.UUID(book_uuid)
+
+
+def books_query(
+    page_token: str, fields: tuple[str, ...] = ALL_FIELDS
+) -> Select[tuple[Book]]:
+    query = (
+        select(Book)
+        .options(load_fields(*fields, "created_at"))
+        .order_by(Book.created_at, Book.uuid)
+    )
+    if page_token:
+        query = query.where(
+            tuple_(Book.created_at, Book.uuid)
+            > tuple_(*decode_page_token(page_token))
+        )
+    return query
 
 
 class BookService(books_pb2_grpc.BookServiceServicer):
+    def __init__(self, database: PostgresDatabase):
+        self._database = database
+
     async def GetBookById(self, request, context):
-        database = get_db()
-        async with database.get_session() as session:
+        fields = await self._read_fields(request, context)
+        async with self._database.get_session() as session:
             result = await session.execute(
-                select(Book).filter(Book.uuid == request.uuid)
+                select(Book)
+                .options(load_fields(*fields))
+                .filter(Book.uuid == request.uuid)
             )
             book = result.scalar_one_or_none()
             if book:
-                return BookResponse(
-                    uuid=str(book.uuid),
-                    title=book.title,
-                    author=book.author,
-                    published_date=book.published_date.isoformat(),
-                )
+                return book_response(book, fields)
             context.set_code(grpc.StatusCode.NOT_FOUND)
             context.set_details("Book not found")
             return BookResponse()
 
     async def GetAllBooks(self, request, context):
-        database = get_db()
-        async with database.get_session() as session:
-            result = await session.execute(select(Book))
+        async with self._database.get_session() as session:
+            result = await session.execute(books_query(""))
             books = result.scalars().all()
             return BooksListResponse(
-                books=[
-                    BookResponse(
-                        uuid=str(book.uuid),
-                        title=book.title,
-                        author=book.author,
-                        published_date=book.published_date.isoformat(),
-                    )
-                    for book in books
-                ]
+                books=[book_response(book) for book in books]
             )
 
+    async def ListBooks(self, request, context):
+        """
+        Stream the books from a server-side cursor.
 
-@broker.subscriber("book_queue")
-async def on_message(body):
-    logger.info(f" [x] Received message from RabbitMQ: {body}")
+        Rows are fetched `STREAM_BATCH_SIZE` at a time, and the next message
+        is only produced once the previous one was written, so a slow client
+        holds back the cursor instead of the books piling up in memory.
+        """
+        fields = await self._read_fields(request, context)
+        query = await self._parse_query(request, context, fields)
+        if request.page_size > 0:
+            query = query.limit(request.page_size)
+        async with self._database.get_session() as session:
+            books = await session.stream_scalars(
+                query.execution_options(yield_per=STREAM_BATCH_SIZE)
+            )
+            async for book in books:
+                yield book_response(book, fields)
+
+    async def ListBooksPage(self, request, context):
+        fields = await self._read_fields(request, context)
+        query = await self._parse_query(request, context, fields)
+        page_size = min(request.page_size or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+        async with self._database.get_session() as session:
+            result = await session.execute(query.limit(page_size + 1))
+            books = result.scalars().all()
+        next_page_token = ""
+        if len(books) > page_size:
+            books = books[:page_size]
+            next_page_token = encode_page_token(books[-1])
+        return ListBooksPageResponse(
+            books=[book_response(book, fields) for book in books],
+            next_page_token=next_page_token,
+        )
+
+    async def BatchGetBooks(self, request, context):
+        try:
+            uuids = list(dict.fromkeys(map(uuid.UUID, request.uuids)))
+        except ValueError:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT, "Invalid book uuid"
+            )
+        if len(uuids) > MAX_PAGE_SIZE:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f"More than {MAX_PAGE_SIZE} uuids",
+            )
+        fields = await self._read_fields(request, context)
+        if not uuids:
+            return BooksListResponse()
+        # Straight to the database on purpose, as every RPC of this server:
+        # it is built without the API and its Redis cache, so unlike the
+        # REST batch get there are no cached books and no tombstones, and
+        # the books are never stale
+        async with self._database.get_session() as session:
+            result = await session.execute(
+                select(Book)
+                .options(load_fields(*fields))
+                .where(
+                    Book.uuid == any_(literal(uuids, ARRAY(UUID(as_uuid=True))))
+                )
+            )
+            books = {book.uuid: book for book in result.scalars()}
+        return BooksListResponse(
+            books=[
+                book_response(books[key], fields)
+                for key in uuids
+                if key in books
+            ]
+        )
+
+    @staticmethod
+    async def _read_fields(request, context) -> tuple[str, ...]:
+        try:
+            return read_fields(request.read_mask)
+        except ValueError as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+
+    @staticmethod
+    async def _parse_query(
+        request, context, fields: tuple[str, ...]
+    ) -> Select[tuple[Book]]:
+        if request.page_size < 0:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT, "page_size is negative"
+            )
+        try:
+            return books_query(request.page_token, fields)
+        except ValueError:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT, "Invalid page_token"
+            )
+
+
+async def on_message(body: bytes):
+    try:
+        event = BookEvent.FromString(body)
+    except DecodeError:
+        logger.warning(f" [x] Skipped a message of unknown format: {body!r}")
+        return
+    logger.info(
+        f" [x] Received {BookEvent.Type.Name(event.type)} event of book "
+        f"{event.book_uuid}, version {event.version}"
+    )
+
+
+SERVER_OPTIONS = [
+    ("grpc.so_reuseport", 1),
+    ("grpc.max_concurrent_streams", MAX_CONCURRENT_STREAMS),
+    ("grpc.max_send_message_length", MAX_MESSAGE_LENGTH),
+    ("grpc.max_receive_message_length", MAX_MESSAGE_LENGTH),
+    ("grpc.keepalive_time_ms", KEEPALIVE_TIME_MS),
+    ("grpc.keepalive_timeout_ms", KEEPALIVE_TIMEOUT_MS),
+    # Accept the keepalive pings of the idle long-lived client channels
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.min_ping_interval_without_data_ms", 10000),
+]
 
 
 async def serve():
-    server = grpc.aio.server(futures.ThreadPoolExecutor(max_workers=10))
-    books_pb2_grpc.add_BookServiceServicer_to_server(BookService(), server)
-    server.add_insecure_port("[::]:50051")
+    database = PostgresDatabase()
+    server = grpc.aio.server(options=SERVER_OPTIONS, compression=COMPRESSION)
+    books_pb2_grpc.add_BookServiceServicer_to_server(
+        BookService(database), server
+    )
+    server.add_insecure_port(f"[::]:{PORT}")
     await server.start()
+    # Every process gets every book change event from its own exclusive queue
+    broker.subscriber(
+        RabbitQueue(
+            f"{events_exchange}.{socket.gethostname()}.{os.getpid()}",
+            exclusive=True,
+            auto_delete=True,
+        ),
+        book_events,
+    )(on_message)
     await broker.start()
-    await server.wait_for_termination()
+    logger.info(f"Serving on port {PORT}")
+
+    stopped = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stopped.set)
+    try:
+        await stopped.wait()
+    finally:
+        # New RPCs are refused while the in-flight ones are drained
+        await server.stop(SHUTDOWN_GRACE)
+        await broker.close()
+        await database.close()
+
+
+def run_worker():
+    # A restarted worker is forked with the handlers of the supervisor
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    asyncio.run(serve())
+
+
+def supervise(workers: int):
+    """
+    Run the server in `workers` forked processes, restarting the ones that
+    exit, until SIGINT or SIGTERM, which is passed on to the workers.
+
+    The processes are forked before any gRPC object is created, as gRPC
+    does not support forking afterwards.
+    """
+    context = multiprocessing.get_context("fork")
+    processes = {}
+    stopping = False
+
+    def start_worker() -> None:
+        if stopping:
+            return
+        process = context.Process(target=run_worker)
+        process.start()
+        processes[process.sentinel] = process
+
+    def stop(signum, frame) -> None:
+        nonlocal stopping
+        stopping = True
+        for process in processes.values():
+            if process.is_alive():
+                os.kill(process.pid, signal.SIGTERM)
+
+    for _ in range(workers):
+        start_worker()
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+    while processes:
+        for sentinel in wait(list(processes)):
+            process = processes.pop(sentinel)
+            process.join()
+            if not stopping:
+                logger.warning(
+                    f"Worker {process.pid} exited with code "
+                    f"{process.exitcode}, restarting it"
+                )
+                time.sleep(RESTART_DELAY)
+                start_worker()
 
 
 if __name__ == "__main__":
@@ -81,8 +404,8 @@ if __name__ == "__main__":
         format="%(asctime)s %(levelname)s - %(name)s - %(message)s",
         handlers=[logging.StreamHandler()],
     )
-    logger = logging.getLogger(__name__)
-
-    import asyncio
 
-    asyncio.run(serve())
+    if WORKERS > 1:
+        supervise(WORKERS)
+    else:
+        run_worker()
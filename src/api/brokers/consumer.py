@@ -0,0 +1,88 @@
+import asyncio
+import logging
+import os
+import socket
+
+from faststream.rabbit import RabbitBroker, RabbitExchange, RabbitQueue
+from faststream.rabbit.subscriber.asyncapi import AsyncAPISubscriber
+from google.protobuf.message import DecodeError
+
+from src.api.brokers.events import SCHEMA_VERSION, decode_book_event
+from src.api.services.book import BookService
+
+logger = logging.getLogger("BookEventConsumer")
+
+
+class BookEventConsumer:
+    """
+    Applies the book change events to the caches of this process.
+
+    Every process consumes from its own exclusive queue bound to the fanout
+    exchange of the events, so each of them gets every event. The broker
+    delivers up to `consumer_prefetch` unacknowledged events at once, and at
+    most `concurrency` of them are applied at the same time.
+    """
+
+    def __init__(
+        self,
+        broker: RabbitBroker,
+        exchange: RabbitExchange,
+        service: BookService,
+        concurrency: int = 4,
+    ):
+        self.__broker = broker
+        self.__exchange = exchange
+        self.__service = service
+        self.__semaphore = asyncio.Semaphore(concurrency)
+        self.__subscriber: AsyncAPISubscriber | None = None
+        self.applied = 0
+        self.skipped = 0
+
+    async def start(self) -> None:
+        """
+        Declare the queue of this process and start consuming the events.
+        """
+        queue = RabbitQueue(
+            f"{self.__exchange.name}.{socket.gethostname()}.{os.getpid()}",
+            exclusive=True,
+            auto_delete=True,
+        )
+        self.__subscriber = self.__broker.subscriber(queue, self.__exchange)
+        self.__subscriber(self._handle)
+        await self.__broker.start()
+
+    async def close(self) -> None:
+        """
+        Stop consuming, the exclusive queue is deleted by the broker.
+        """
+        if self.__subscriber is not None:
+            await self.__subscriber.close()
+            self.__subscriber = None
+
+    async def _handle(self, body: bytes) -> None:
+        try:
+            event = decode_book_event(body)
+        except DecodeError:
+            logger.warning("Skipped a message of unknown format")
+            self.skipped += 1
+            return
+        if event.schema_version > SCHEMA_VERSION:
+            logger.warning(
+                "Skipped an event of unsupported version %d",
+                event.schema_version,
+            )
+            self.skipped += 1
+            return
+        async with self.__semaphore:
+            await self.__service.apply_event(event)
+        self.applied += 1
+
+    def stats(self) -> dict[str, int]:
+        return {"applied": self.applied, "skipped": self.skipped}
+
+
+book_event_consumer: BookEventConsumer | None = None
+
+
+async def get_book_event_consumer() -> BookEventConsumer | None:
+    return book_event_consumer
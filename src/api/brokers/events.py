@@ -0,0 +1,90 @@
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from typing import Any
+
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from src.api.brokers.events_pb2 import Book, BookEvent
+
+# Version of the BookEvent format, see events.proto
+SCHEMA_VERSION = 1
+CONTENT_TYPE = "application/x-protobuf; messageType=books.events.BookEvent"
+BOOK_FIELDS = ("title", "author", "published_date")
+
+
+def _timestamp(value: datetime | None) -> Timestamp | None:
+    if value is None:
+        return None
+    timestamp = Timestamp()
+    timestamp.FromDatetime(value)
+    return timestamp
+
+
+def encode_book_event(
+    event_type: BookEvent.Type,
+    book: Any,
+    changed_fields: Iterable[str] = BOOK_FIELDS,
+) -> bytes:
+    """
+    Encode a change of the book as a BookEvent.
+
+    Args:
+        event_type: CREATED, UPDATED or DELETED.
+        book: The book row after the change, or the removed one.
+        changed_fields: The fields set by the change.
+
+    Returns:
+        bytes: The serialized event.
+    """
+    event = BookEvent(
+        schema_version=SCHEMA_VERSION,
+        type=event_type,
+        book_uuid=str(book.uuid),
+        occurred_at=_timestamp(
+            datetime.now(UTC)
+            if event_type == BookEvent.DELETED
+            else book.updated_at
+        ),
+    )
+    event.version = book.version
+    if event_type == BookEvent.DELETED:
+        # The removal is a change of its own, newer than the last update
+        event.version += 1
+    event.changed_fields.paths.extend(changed_fields)
+    event.book.CopyFrom(
+        Book(
+            title=book.title,
+            author=book.author,
+            published_date=_timestamp(book.published_date),
+            created_at=_timestamp(book.created_at),
+            updated_at=_timestamp(book.updated_at),
+        )
+    )
+    return event.SerializeToString()
+
+
+def decode_book_event(data: bytes) -> BookEvent:
+    return BookEvent.FromString(data)
+
+
+def _datetime(value: Timestamp, present: bool) -> datetime | None:
+    return value.ToDatetime(tzinfo=UTC) if present else None
+
+
+def book_event_fields(event: BookEvent) -> dict[str, Any]:
+    """
+    Get the fields of the book carried by the event, as stored in the
+    database.
+    """
+    book = event.book
+    return {
+        "uuid": event.book_uuid,
+        "version": event.version,
+        "title": book.title,
+        "author": book.author if book.HasField("author") else None,
+        "published_date": _datetime(
+            book.published_date, book.HasField("published_date")
+        ),
+        "created_at": _datetime(book.created_at, book.HasField("created_at")),
+        "updated_at": _datetime(book.updated_at, book.HasField("updated_at")),
+    }
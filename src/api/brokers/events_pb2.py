@@ -0,0 +1,44 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: events.proto
+# Protobuf Python Version: 5.27.2
+"""Generated protocol buffer code."""
+
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC, 5, 27, 2, "", "events.proto"
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import (
+    field_mask_pb2 as google_dot_protobuf_dot_field__mask__pb2,
+)
+from google.protobuf import (
+    timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2,
+)
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
+    b'\n\x0c\x65vents.proto\x12\x0c\x62ooks.events\x1a google/protobuf/field_mask.proto\x1a\x1fgoogle/protobuf/timestamp.proto"\xbf\x02\n\tBookEvent\x12\x16\n\x0eschema_version\x18\x01 \x01(\r\x12*\n\x04type\x18\x02 \x01(\x0e\x32\x1c.books.events.BookEvent.Type\x12\x11\n\tbook_uuid\x18\x03 \x01(\t\x12\x0f\n\x07version\x18\x04 \x01(\x04\x12\x32\n\x0e\x63hanged_fields\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\x12 \n\x04\x62ook\x18\x06 \x01(\x0b\x32\x12.books.events.Book\x12/\n\x0boccurred_at\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp"C\n\x04Type\x12\x14\n\x10TYPE_UNSPECIFIED\x10\x00\x12\x0b\n\x07\x43REATED\x10\x01\x12\x0b\n\x07UPDATED\x10\x02\x12\x0b\n\x07\x44\x45LETED\x10\x03"\xc9\x01\n\x04\x42ook\x12\r\n\x05title\x18\x01 \x01(\t\x12\x13\n\x06\x61uthor\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x32\n\x0epublished_date\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\ncreated_at\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.TimestampB\t\n\x07_authorb\x06proto3'
+)
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, "events_pb2", _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+    DESCRIPTOR._loaded_options = None
+    _globals["_BOOKEVENT"]._serialized_start = 98
+    _globals["_BOOKEVENT"]._serialized_end = 417
+    _globals["_BOOKEVENT_TYPE"]._serialized_start = 350
+    _globals["_BOOKEVENT_TYPE"]._serialized_end = 417
+    _globals["_BOOK"]._serialized_start = 420
+    _globals["_BOOK"]._serialized_end = 621
+# @@protoc_insertion_point(module_scope)
@@ -1,9 +1,123 @@
-from faststream.rabbit import RabbitBroker
+import asyncio
+import logging
+from collections.abc import Sequence
+from typing import Any, NamedTuple
+
+from faststream.rabbit import ExchangeType, RabbitBroker, RabbitExchange
 
 from src.configs import settings
 
-rabbit_broker: RabbitBroker = RabbitBroker(settings.rabbit.dsn)
+logger = logging.getLogger("EventPublisher")
+
+rabbit_broker: RabbitBroker = RabbitBroker(
+    settings.rabbit.dsn,
+    reconnect_interval=settings.rabbit.reconnect_interval,
+    publisher_confirms=True,
+    # Prefetch of the consumers, the publishing is not limited by it
+    max_consumers=settings.rabbit.consumer_prefetch,
+)
+
+# Book change events, delivered to every API and gRPC process
+book_events_exchange = RabbitExchange(
+    settings.rabbit.events_exchange, type=ExchangeType.FANOUT, durable=True
+)
+
+
+class Message(NamedTuple):
+    body: Any
+    routing_key: str
+    content_type: str | None = None
+    exchange: str | None = None
+
+
+class EventPublisher:
+    """
+    Publishes messages over the long-lived, automatically reconnecting
+    broker connection.
+
+    The messages of a batch are sent together on the channel and their
+    publisher confirms are awaited in one round, instead of one round trip
+    per message.
+    """
+
+    def __init__(
+        self,
+        broker: RabbitBroker,
+        timeout: float = 10.0,
+        exchanges: Sequence[RabbitExchange] = (),
+    ):
+        self.__broker = broker
+        self.__exchanges = exchanges
+        self.__timeout = timeout
+        self.published = 0
+        self.failed = 0
+        self.batches = 0
+
+    async def start(self) -> None:
+        """
+        Connect to the broker and declare the exchanges.
+        """
+        await self.__broker.connect()
+        for exchange in self.__exchanges:
+            await self.__broker.declare_exchange(exchange)
+
+    async def close(self) -> None:
+        """
+        Close the connection with the broker.
+        """
+        await self.__broker.close()
+        logger.info("Connection to RabbitMQ was closed.")
+
+    async def publish_batch(
+        self, messages: list[Message]
+    ) -> list[BaseException | None]:
+        """
+        Publish the messages at once and wait for all the confirms.
+
+        Returns:
+            The error of every message, None for the confirmed ones.
+        """
+        results = await asyncio.gather(
+            *(
+                self.__broker.publish(
+                    message.body,
+                    exchange=message.exchange,
+                    routing_key=message.routing_key,
+                    content_type=message.content_type,
+                    timeout=self.__timeout,
+                )
+                for message in messages
+            ),
+            return_exceptions=True,
+        )
+        errors = [
+            result if isinstance(result, BaseException) else None
+            for result in results
+        ]
+        failed = sum(error is not None for error in errors)
+        self.batches += 1
+        self.published += len(errors) - failed
+        self.failed += failed
+        return errors
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "published": self.published,
+            "failed": self.failed,
+            "batches": self.batches,
+        }
+
+
+event_publisher: EventPublisher = EventPublisher(
+    rabbit_broker,
+    settings.rabbit.publish_timeout,
+    [book_events_exchange],
+)
 
 
 def get_rabbit_broker() -> RabbitBroker:
     return rabbit_broker
+
+
+def get_event_publisher() -> EventPublisher:
+    return event_publisher
@@ -1,12 +1,16 @@
 from http import HTTPStatus
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
 from src.api.schemas.api.v1.base import StringRepresent
 from src.api.schemas.api.v1.books import (
     RequestBookCreate,
+    RequestBooksBatchGet,
     RequestBookUpdate,
     ResponseBook,
+    ResponseBooksBatch,
+    ResponseBooksCursorPaginated,
     ResponseBooksPaginated,
 )
 from src.api.services.book import BookService, get_book_service
@@ -16,57 +20,118 @@ from src.api.validators.book import (
     book_uuid_annotation,
     get_book_validator,
 )
-from src.utils.pagination import Paginator, get_paginator
+from src.utils.pagination import (
+    CursorPaginator,
+    Paginator,
+    get_cursor_paginator,
+    get_paginator,
+)
 
 router = APIRouter()
 
 
+def json_response(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json")
+
+
 @router.get(
     "/",
-    response_model=ResponseBooksPaginated,
+    response_model=ResponseBooksPaginated | ResponseBooksCursorPaginated,
     summary="Get a list of books",
     dependencies=[Depends(get_me)],
 )
 async def get_books(
+    pagination: Annotated[
+        Literal["page", "cursor"],
+        Query(
+            alias="pagination",
+            title="Pagination mode",
+            description="'page' to paginate by page number, "
+            "'cursor' to paginate by cursor",
+        ),
+    ] = "page",
     books_service: BookService = Depends(get_book_service),
     paginator: Paginator = Depends(get_paginator),
-) -> ResponseBooksPaginated:
+    cursor_paginator: CursorPaginator = Depends(get_cursor_paginator),
+) -> Response:
     """Available to authorized users
 
     Get a list of books
 
     Args:
-    - **page_number** (str): The number of the page to get
+    - **pagination** (str): The pagination mode, "page" or "cursor"
+    - **page_number** (str): The number of the page to get, "page" mode only
+    - **cursor** (str): The cursor of the page to get, "cursor" mode only
     - **page_size** (str): The size of the page to get
 
     Returns:
-    - **ResponseBooksPaginated**: The list of books: list[ResponseBook]
+    - **ResponseBooksPaginated**: The list of books: list[ResponseBook],
+    in "page" mode
+    - **ResponseBooksCursorPaginated**: The list of books: list[ResponseBook],
+    in "cursor" mode
+
+    The serialized response body is cached, so a cache hit is sent as is
     """
-    paginated_data = await paginator(
-        books_service,
-        "get_all",
-    )
-    if not paginated_data:
-        raise HTTPException(
-            status_code=HTTPStatus.NOT_FOUND, detail="books not found"
+    if pagination == "cursor":
+        cache_key = await books_service.get_response_cache_key(
+            "get_all", pagination=pagination, **cursor_paginator.params
         )
-    return ResponseBooksPaginated(
-        count=paginated_data.count,
-        total_pages=paginated_data.total_pages,
-        prev=paginated_data.prev,
-        next=paginated_data.next,
-        books=[
-            ResponseBook(
-                uuid=book.uuid,
-                title=book.title,
-                author=book.author,
-                published_date=book.published_date,
-                created_at=book.created_at,
-                updated_at=book.updated_at,
+    else:
+        cache_key = await books_service.get_response_cache_key(
+            "get_all", pagination=pagination, **paginator.params
+        )
+    cached_body = await books_service.get_cached_response(cache_key, "get_all")
+    if cached_body is not None:
+        return json_response(cached_body)
+
+    response: ResponseBooksPaginated | ResponseBooksCursorPaginated
+    if pagination == "cursor":
+        cursor_data = await cursor_paginator(books_service, "get_all")
+        response = ResponseBooksCursorPaginated(
+            prev_cursor=cursor_data.prev_cursor,
+            next_cursor=cursor_data.next_cursor,
+            books=[
+                ResponseBook(
+                    uuid=book.uuid,
+                    title=book.title,
+                    author=book.author,
+                    published_date=book.published_date,
+                    created_at=book.created_at,
+                    updated_at=book.updated_at,
+                )
+                for book in cursor_data.results
+            ],
+        )
+    else:
+        paginated_data = await paginator(
+            books_service,
+            "get_all",
+        )
+        if not paginated_data:
+            raise HTTPException(
+                status_code=HTTPStatus.NOT_FOUND, detail="books not found"
             )
-            for book in paginated_data.results
-        ],
-    )
+        response = ResponseBooksPaginated(
+            count=paginated_data.count,
+            total_pages=paginated_data.total_pages,
+            count_is_exact=paginated_data.count_is_exact,
+            prev=paginated_data.prev,
+            next=paginated_data.next,
+            books=[
+                ResponseBook(
+                    uuid=book.uuid,
+                    title=book.title,
+                    author=book.author,
+                    published_date=book.published_date,
+                    created_at=book.created_at,
+                    updated_at=book.updated_at,
+                )
+                for book in paginated_data.results
+            ],
+        )
+    body = response.model_dump_json().encode()
+    await books_service.set_cached_response(cache_key, body, "get_all")
+    return json_response(body)
 
 
 @router.get(
@@ -79,7 +144,7 @@ async def get_books(
 async def get_book(
     book_uuid: book_uuid_annotation,
     books_service: BookService = Depends(get_book_service),
-) -> ResponseBook:
+) -> Response:
     """Available to authorized users
 
     Get a book details by uuid
@@ -89,13 +154,63 @@ async def get_book(
 
     Returns:
     - **ResponseBook**: The book details
+
+    The serialized response body is cached, so a cache hit is sent as is
     """
+    cache_key = await books_service.get_response_cache_key(
+        "get", str(book_uuid)
+    )
+    cached_body = await books_service.get_cached_response(cache_key, "get")
+    if cached_body is not None:
+        # Counted here, the service is not called on a cached response
+        books_service.record_access(book_uuid)
+        return json_response(cached_body)
+
     book = await books_service.get(book_uuid)
     if not book:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND, detail="book not found"
         )
-    return book
+    body = (
+        ResponseBook.model_validate(book, from_attributes=True)
+        .model_dump_json(exclude_none=True)
+        .encode()
+    )
+    await books_service.set_cached_response(cache_key, body, "get")
+    return json_response(body)
+
+
+@router.post(
+    "/batch-get",
+    response_model=ResponseBooksBatch,
+    summary="Get the books by uuids",
+    dependencies=[Depends(get_me)],
+)
+async def batch_get_books(
+    body: RequestBooksBatchGet,
+    books_service: BookService = Depends(get_book_service),
+) -> ResponseBooksBatch:
+    """Available to authorized users
+
+    Get the books by uuids
+
+    Args:
+    - **uuids** (list[str]): The UUIDs of the books to get, up to 100
+
+    Returns:
+    - **ResponseBooksBatch**: The books found: list[ResponseBook], in the
+    order of the UUIDs
+
+    The cached books are read in one round trip and the rest are loaded
+    with a single query
+    """
+    books = await books_service.get_many(body.uuids)
+    return ResponseBooksBatch(
+        books=[
+            ResponseBook.model_validate(book, from_attributes=True)
+            for book in books
+        ]
+    )
 
 
 @router.post(
@@ -148,6 +263,11 @@ async def update_book(
     book = await books_service.update(
         await book_validator.is_exists(book_uuid), body
     )
+    # Removed after the check
+    if not book:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND, detail="book not found"
+        )
     return book
 
 
@@ -0,0 +1,62 @@
+from typing import Any
+
+from fastapi import APIRouter, Depends
+
+from src.api.brokers.consumer import (
+    BookEventConsumer,
+    get_book_event_consumer,
+)
+from src.api.brokers.rabbitmq import EventPublisher, get_event_publisher
+from src.api.services.book import BookService, get_book_service
+from src.api.services.outbox import OutboxRelay, get_outbox_relay
+from src.api.services.user import is_admin
+from src.cache.abstract import AbstractCache
+from src.cache.tiered import get_tiered_cache
+from src.db.clients.postgres import PostgresDatabase, get_postgres_db
+from src.db.clients.redis import RedisConnectionPool, get_redis_pool
+
+router = APIRouter()
+
+
+@router.get(
+    "/",
+    response_model=dict[str, dict[str, Any]],
+    summary="Get the runtime metrics of the current process",
+    dependencies=[Depends(is_admin)],
+)
+async def get_metrics(
+    database: PostgresDatabase = Depends(get_postgres_db),
+    redis_pool: RedisConnectionPool = Depends(get_redis_pool),
+    cache: AbstractCache = Depends(get_tiered_cache),
+    books_service: BookService = Depends(get_book_service),
+    publisher: EventPublisher = Depends(get_event_publisher),
+    outbox: OutboxRelay = Depends(get_outbox_relay),
+    events: BookEventConsumer = Depends(get_book_event_consumer),
+) -> dict[str, dict[str, Any]]:
+    """Only available to administrator
+
+    Get the runtime metrics of the current API process
+
+    Returns:
+    - **dict**: Metrics grouped by component:
+      - **postgres**: connection pool size, checkouts and wait times
+      - **redis**: connections in use, checkouts and wait times of the
+        pool shared by the cache and the rate limiter
+      - **cache**: hits, misses and evictions per cache tier
+      - **books**: hits, hits on cached misses (tombstones), database loads
+        and background refreshes per book service method
+      - **rabbit**: published and failed events, publish batches
+      - **outbox**: events relayed from the outbox by this process and
+        events the broker did not confirm
+      - **events**: book change events applied to the caches by this
+        process and skipped ones
+    """
+    return {
+        "postgres": database.pool_status(),
+        "redis": redis_pool.pool_status(),
+        "cache": cache.stats(),
+        "books": books_service.stats(),
+        "rabbit": publisher.stats(),
+        "outbox": outbox.stats(),
+        "events": events.stats(),
+    }
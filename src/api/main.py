@@ -5,32 +5,75 @@ from typing import Any
 import uvicorn
 from fastapi import FastAPI
 from fastapi_limiter import FastAPILimiter
-from redis.asyncio import Redis
 
+from src.api.brokers import consumer
+from src.api.brokers.rabbitmq import (
+    book_events_exchange,
+    event_publisher,
+    rabbit_broker,
+)
 from src.api.endpoints.v1 import (
     books,
+    metrics,
     users,
 )
+from src.api.services import outbox
+from src.api.services.book import get_book_service
 from src.api.services.start_up import StartUpService
-from src.cache import redis
-from src.configs import LOGGING, PostgresSettings, settings
-from src.db.clients.postgres import get_postgres_db
+from src.cache import redis, tiered
+from src.cache.codecs import get_codec
+from src.configs import LOGGING, settings
+from src.db.clients import postgres
+from src.db.clients import redis as redis_client
+from src.db.repositories.book import get_book_repository
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> Any:
+    postgres.postgres_db = postgres.PostgresDatabase(settings.postgres)
     if settings.start_up.start_up_flag:
-        db_settings = PostgresSettings()
-        db = get_postgres_db(db_settings)
         startup_methods: StartUpService = StartUpService(
-            database=db, settings=settings.start_up
+            database=postgres.postgres_db, settings=settings.start_up
         )
         await startup_methods.create_admin_user()
-    redis.redis = redis.RedisCache(Redis(**settings.redis.connection_dict))
-    await FastAPILimiter.init(Redis(**settings.redis.connection_dict))
+    redis_client.redis_pool = redis_client.RedisConnectionPool(settings.redis)
+    redis.redis = redis.RedisCache(
+        redis_client.redis_pool.client(),
+        settings.cache.generation_ttl,
+        get_codec(settings.cache.codec, settings.cache.compress_threshold),
+    )
+    tiered.tiered_cache = tiered.TieredCache(redis.redis, settings.cache)
+    await tiered.tiered_cache.start()
+    await FastAPILimiter.init(redis_client.redis_pool.client())
+    await event_publisher.start()
+    outbox.outbox_relay = outbox.OutboxRelay(
+        postgres.postgres_db, event_publisher, settings.outbox
+    )
+    if settings.outbox.relay_enabled:
+        await outbox.outbox_relay.start()
+    # Called with keywords, as FastAPI does, to get the cached instance
+    books_service = get_book_service(
+        repository=get_book_repository(database=postgres.postgres_db),
+        cache=tiered.tiered_cache,
+        outbox=outbox.outbox_relay,
+    )
+    books_service.schedule_warm_up()
+    consumer.book_event_consumer = consumer.BookEventConsumer(
+        rabbit_broker,
+        book_events_exchange,
+        books_service,
+        settings.rabbit.consumer_concurrency,
+    )
+    await consumer.book_event_consumer.start()
     yield
-    await redis.redis.close()
+    await consumer.book_event_consumer.close()
+    await books_service.close()
+    await outbox.outbox_relay.close()
+    await event_publisher.close()
+    await tiered.tiered_cache.close()
     await FastAPILimiter.close()
+    await redis_client.redis_pool.close()
+    await postgres.postgres_db.close()
 
 
 app = FastAPI(
@@ -49,6 +92,12 @@ app.include_router(
     tags=["users"],
 )
 
+app.include_router(
+    metrics.router,
+    prefix="/book/v1/metrics",
+    tags=["metrics"],
+)
+
 if __name__ == "__main__":
     uvicorn.run(
         "main:app",
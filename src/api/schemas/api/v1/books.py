@@ -1,4 +1,5 @@
 from datetime import datetime
+from uuid import UUID
 
 from pydantic import BaseModel, Field
 
@@ -6,7 +7,7 @@ from src.api.schemas.api.v1.base import (
     TimeMixin,
     UUIDMixin,
 )
-from src.utils.pagination import PaginatedMixin
+from src.utils.pagination import CursorPaginatedMixin, PaginatedMixin
 
 
 class Book(BaseModel):
@@ -37,9 +38,26 @@ class ResponseBooksPaginated(PaginatedMixin):
     books: list[ResponseBook]
 
 
+class ResponseBooksCursorPaginated(CursorPaginatedMixin):
+    books: list[ResponseBook]
+
+
+class ResponseBooksBatch(BaseModel):
+    books: list[ResponseBook]
+
+
 class RequestBookCreate(Book): ...
 
 
+class RequestBooksBatchGet(BaseModel):
+    uuids: list[UUID] = Field(
+        description="UUID книг, отсутствующие книги пропускаются",
+        examples=[["123e4567-e89b-12d3-a456-426614174000"]],
+        min_length=1,
+        max_length=100,
+    )
+
+
 class RequestBookUpdate(BaseModel):
     author: str = Field(
         description="Имя автора",
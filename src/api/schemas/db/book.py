@@ -22,3 +22,7 @@ class BookDB(BaseMixin):
         description="Дата публикации книги",
         examples=["2024-04-19"],
     )
+    version: int = Field(
+        default=0,
+        description="Версия книги, растёт с каждым её изменением",
+    )
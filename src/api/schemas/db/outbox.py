@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+
+
+class OutboxMessage(BaseModel):
+    exchange: str | None = Field(
+        default=None,
+        description="Обменник события, обменник по умолчанию если не указан",
+    )
+    routing_key: str = Field(description="Ключ маршрутизации события")
+    payload: bytes = Field(description="Тело события")
+    content_type: str | None = Field(
+        default=None, description="Тип содержимого тела события"
+    )
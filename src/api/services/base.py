@@ -1,17 +1,41 @@
-import json
-from typing import Generic, TypeVar
+import asyncio
+import contextlib
+import logging
+import math
+import random
+import time
+from collections import Counter, defaultdict
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import datetime
+from functools import partial
+from typing import Any, Generic, Literal, NamedTuple, TypeVar
 from uuid import UUID
 
-from faststream.rabbit import RabbitBroker
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
+from src.api.services.outbox import OutboxRelay
 from src.cache.abstract import AbstractCache
-from src.db.repositories.abstract import AbstractRepository
+from src.cache.codecs import CacheMetadata, CodecError
+from src.configs import settings
+from src.configs.cache import CacheTTL
+from src.db.repositories.abstract import AbstractRepository, EventFactory
+from src.utils.single_flight import SingleFlight
+from src.utils.sketch import FrequencySketch
+
+logger = logging.getLogger("BaseService")
+
+LOCK_POLL_INTERVAL = 0.05
 
 DBSchemaType = TypeVar("DBSchemaType", bound=BaseModel)
 DBSchemaPaginationType = TypeVar("DBSchemaPaginationType", bound=BaseModel)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
+Change = Literal["created", "updated", "deleted"]
+
+
+class CachedValue(NamedTuple):
+    value: Any
+    metadata: CacheMetadata
 
 
 class InitService:
@@ -33,101 +57,657 @@ class BaseService(
         repository: AbstractRepository,
         model: type[BaseModel],
         cache: AbstractCache,
-        broker: RabbitBroker,
+        outbox: OutboxRelay | None = None,
     ):
         super().__init__(repository, model)
         self._cache = cache
         self._service_name = self.__class__.__name__.lower()
-        self._broker = broker
+        self._outbox = outbox
+        self._cache_settings = settings.cache
+        self._single_flight = SingleFlight()
+        self._adapter = TypeAdapter(model)
+        self._optional_adapter = TypeAdapter(model | None)
+        self._list_adapter = TypeAdapter(list[model])
+        self._count_adapter = TypeAdapter(int)
+        self._uuids_adapter = TypeAdapter(list[UUID])
+        self._pages_index = f"{self._service_name}:get_all"
+        self._refreshes: dict[str, asyncio.Task[None]] = {}
+        self._stats: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        self._popularity = FrequencySketch(
+            top_k=self._cache_settings.warm_up_top_k
+        )
+        self._warm_up_task: asyncio.Task[None] | None = None
+        # The warm-up waiting to run: "pages" for the pages and the counts
+        # only, "all" for the most requested instances too
+        self._warm_up_pending: Literal["pages", "all"] | None = None
 
     async def get(self, instance_uuid: UUID) -> DBSchemaType | None:
-        cache_key = self._cache.generate_cache_key(
-            self._service_name, "get", str(instance_uuid)
+        """
+        Get an instance by UUID.
+
+        A missing instance is cached as a tombstone for `negative_ttl`
+        seconds, so repeated requests for unknown UUIDs skip the database.
+        """
+        self.record_access(instance_uuid)
+        return await self._get(instance_uuid)
+
+    def record_access(self, instance_uuid: UUID) -> None:
+        """
+        Count a request of the instance, for the warm-up of the most
+        requested ones. Called on every request, cached responses included.
+        """
+        self._popularity.add(str(instance_uuid))
+
+    async def _get(self, instance_uuid: UUID) -> DBSchemaType | None:
+        cache_key = await self._get_item_cache_key(instance_uuid)
+        return await self._get_or_load(
+            cache_key,
+            partial(self._repository.get, instance_uuid),
+            self._optional_adapter,
+            "get",
+            cache_misses=True,
         )
-        cached_data = await self._cache.get(cache_key)
-        if cached_data:
-            return self._model.model_validate(json.loads(cached_data))
 
-        obj = await self._repository.get(instance_uuid)
-        if obj is None:
-            return None
-        model = self._model.model_validate(obj, from_attributes=True)
+    async def get_many(self, instance_uuids: list[UUID]) -> list[DBSchemaType]:
+        """
+        Get the instances by UUID, in the order of the UUIDs, skipping the
+        missing ones.
 
-        serializable_data = self._cache.make_serializable(model.model_dump())
-        await self._cache.set(cache_key, json.dumps(serializable_data))
+        The cached instances are read in one round trip, and the misses and
+        the stale ones are loaded with one query and cached, the missing
+        ones as tombstones.
+        """
+        uuids = list(dict.fromkeys(instance_uuids))
+        keys = [await self._get_item_cache_key(uuid) for uuid in uuids]
+        stats = self._stats["get_many"]
+        found: dict[UUID, DBSchemaType] = {}
+        to_load: list[UUID] = []
+        for uuid, cached_data in zip(uuids, await self._cache.get_many(keys)):
+            self.record_access(uuid)
+            cached = None
+            if cached_data:
+                with contextlib.suppress(CodecError):
+                    cached = CachedValue(
+                        self._cache.loads(cached_data, self._optional_adapter),
+                        self._cache.metadata(cached_data),
+                    )
+            if cached is None:
+                stats["misses"] += 1
+                to_load.append(uuid)
+            elif cached.value is None:
+                stats["negative_hits"] += 1
+            elif self._is_stale(cached.metadata):
+                stats["refreshes"] += 1
+                found[uuid] = cached.value
+                to_load.append(uuid)
+            else:
+                stats["hits"] += 1
+                found[uuid] = cached.value
+        if to_load:
+            await self._load_many(to_load, found)
+        return [found[uuid] for uuid in uuids if uuid in found]
 
-        return model
+    async def _load_many(
+        self, instance_uuids: list[UUID], found: dict[UUID, DBSchemaType]
+    ) -> None:
+        started = time.perf_counter()
+        objs = await self._repository.get_many(instance_uuids)
+        delta = time.perf_counter() - started
+        ttl = self._get_ttl("get")
+        items = {}
+        for obj in objs:
+            model = self._model.model_validate(obj, from_attributes=True)
+            found[model.uuid] = model
+            items[await self._get_item_cache_key(model.uuid)] = (
+                self._cache.dumps(model, ttl.soft, delta)
+            )
+        if items:
+            await self._cache.set_many(items, ttl.hard)
+        loaded = {obj.uuid for obj in objs}
+        missing = [uuid for uuid in instance_uuids if uuid not in loaded]
+        for uuid in missing:
+            # A stale instance may have been removed since it was cached
+            found.pop(uuid, None)
+        if missing and self._cache_settings.negative_ttl:
+            await self._cache.set_many(
+                {
+                    await self._get_item_cache_key(uuid): self._cache.dumps(
+                        None
+                    )
+                    for uuid in missing
+                },
+                self._cache_settings.negative_ttl,
+            )
+
+    def schedule_warm_up(self, pages_only: bool = False) -> None:
+        """
+        Warm up the cache in the background.
+
+        At most one warm-up is pending: the ones requested while another one
+        is waiting or running are coalesced into a single run after it. A
+        warm-up of the pages only, as requested by the writes, waits
+        `warm_up_delay` seconds, so a burst of writes is followed by one.
+        """
+        if not self._cache_settings.warm_up:
+            return
+        if not pages_only:
+            self._warm_up_pending = "all"
+        elif self._warm_up_pending is None:
+            self._warm_up_pending = "pages"
+        if self._warm_up_task is None or self._warm_up_task.done():
+            self._warm_up_task = asyncio.create_task(self._run_warm_up())
+
+    async def close(self) -> None:
+        """
+        Cancel the background warm-up and refreshes.
+        """
+        tasks = [*self._refreshes.values()]
+        if self._warm_up_task is not None:
+            tasks.append(self._warm_up_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run_warm_up(self) -> None:
+        while self._warm_up_pending is not None:
+            if self._warm_up_pending == "pages":
+                await asyncio.sleep(self._cache_settings.warm_up_delay)
+            pending, self._warm_up_pending = self._warm_up_pending, None
+            try:
+                await self.warm_up(items=pending == "all")
+            except Exception:
+                logger.exception("Failed to warm up the cache")
+
+    async def warm_up(self, items: bool = True) -> None:
+        """
+        Load into the cache the counts, the first `warm_up_pages` pages of
+        every configured page size (both for page number and for cursor
+        pagination) and, unless `items` is false, the `warm_up_top_k` most
+        requested instances.
+
+        Only the entries missing from the cache are loaded from the database,
+        at most `warm_up_concurrency` at a time.
+        """
+        cache_settings = self._cache_settings
+        loads: list[Callable[[], Awaitable[Any]]] = [self.count]
+        if settings.pagination.approximate_count:
+            loads.append(self.count_estimate)
+        for page_size in cache_settings.warm_up_page_sizes:
+            # The first cursor page is fetched with one extra row
+            loads.append(partial(self.get_all, limit=page_size + 1))
+            loads.extend(
+                partial(self.get_all, limit=page_size, offset=offset)
+                for offset in range(
+                    0, cache_settings.warm_up_pages * page_size, page_size
+                )
+            )
+        if items:
+            loads.extend(
+                partial(self._get, UUID(key)) for key in self._popularity.top()
+            )
+        semaphore = asyncio.Semaphore(cache_settings.warm_up_concurrency)
+
+        async def run(load: Callable[[], Awaitable[Any]]) -> Any:
+            async with semaphore:
+                return await load()
+
+        results = await asyncio.gather(
+            *(run(load) for load in loads), return_exceptions=True
+        )
+        failed = sum(isinstance(result, Exception) for result in results)
+        logger.info(
+            "Cache of %s warmed up: %d entries, %d failed",
+            self._service_name,
+            len(loads),
+            failed,
+        )
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """
+        Get the cache usage of the service methods: hits, hits on cached
+        misses (tombstones), misses loaded from the database and background
+        refreshes.
+        """
+        return {
+            method: dict(counter) for method, counter in self._stats.items()
+        }
 
     async def get_all(self, **kwargs) -> list[DBSchemaType] | None:
-        cache_key = self._cache.generate_cache_key(
+        """
+        Get a page of instances.
+
+        The page is cached as the list of the instance UUIDs, the instances
+        themselves are cached under their own keys, so a page is assembled
+        with one batched read and a changed instance is evicted only once.
+        """
+        cache_key = await self._cache.generate_cache_key(
             service_name=self._service_name, method_name="get_all", **kwargs
         )
+        return await self._get_or_load(
+            cache_key,
+            partial(self._repository.get_all, **kwargs),
+            self._list_adapter,
+            "get_all",
+            reader=partial(self._read_page, cache_key),
+            writer=partial(self._write_page, cache_key, kwargs),
+        )
+
+    async def get_response_cache_key(
+        self, method_name: str, *args: Any, **kwargs: Any
+    ) -> str:
+        """
+        Generate the key of a serialized response body of the method.
+        """
+        return await self._cache.generate_cache_key(
+            self._service_name, f"{method_name}_response", *args, **kwargs
+        )
+
+    async def get_cached_response(
+        self, cache_key: str, method_name: str
+    ) -> bytes | None:
+        body = await self._cache.get(cache_key)
+        self._stats[f"{method_name}_response"][
+            "hits" if body is not None else "misses"
+        ] += 1
+        return body
+
+    async def set_cached_response(
+        self, cache_key: str, body: bytes, method_name: str
+    ) -> None:
+        """
+        Cache the serialized response body of the method until its soft TTL
+        runs out, or its hard TTL if it has none.
+
+        The bodies are sent as is, without the freshness metadata, so they
+        are not served stale: once expired, the response is built again from
+        the cached instances, which are refreshed in the background.
+        """
+        ttl = self._get_ttl(f"{method_name}_response")
+        expire = math.ceil(ttl.soft) if ttl.soft else ttl.hard
+        await self._cache.set(cache_key, body, min(expire, ttl.hard))
+
+    def _get_ttl(self, method_name: str) -> CacheTTL:
+        return self._cache_settings.get_ttl(self._service_name, method_name)
+
+    async def _get_item_cache_key(self, instance_uuid: UUID) -> str:
+        return await self._cache.generate_cache_key(
+            self._service_name, "get", str(instance_uuid)
+        )
+
+    async def _get_or_load(
+        self,
+        cache_key: str,
+        loader: Callable[[], Awaitable[Any]],
+        adapter: TypeAdapter[Any],
+        method_name: str,
+        reader: Callable[[], Awaitable[CachedValue | None]] | None = None,
+        writer: Callable[[Any, float], Awaitable[None]] | None = None,
+        cache_misses: bool = False,
+    ) -> Any:
+        """
+        Get the data from the cache or load it from the repository.
+
+        `reader` returns the cached data or None on a miss and `writer` puts
+        the loaded data into the cache, by default the data is stored as a
+        single value under `cache_key` with the TTL of `method_name`. With
+        `cache_misses` a None loaded from the repository is cached too.
+
+        A stale value is returned as is, while it is refreshed in the
+        background.
+        """
+        reader = reader or partial(self._read, cache_key, adapter)
+        writer = writer or partial(
+            self._write, cache_key, self._get_ttl(method_name)
+        )
+        load = partial(
+            self._load,
+            cache_key,
+            loader,
+            adapter,
+            reader,
+            writer,
+            cache_misses=cache_misses,
+        )
+        stats = self._stats[method_name]
+        cached = await reader()
+        if cached is not None:
+            stats["hits" if cached.value is not None else "negative_hits"] += 1
+            if self._is_stale(cached.metadata):
+                stats["refreshes"] += 1
+                self._refresh_in_background(
+                    cache_key, partial(load, refresh=True)
+                )
+            return cached.value
+        stats["misses"] += 1
+        return await self._single_flight.do(cache_key, load)
+
+    def _is_stale(self, metadata: CacheMetadata) -> bool:
+        """
+        Check if the value should be refreshed.
+
+        Implements the XFetch probabilistic early expiration: the value is
+        refreshed ahead of its soft expiry with a probability growing as the
+        expiry nears and with the time it takes to compute, so the refreshes
+        of the hot keys are spread out.
+        """
+        if not metadata.fresh_until:
+            return False
+        early = (
+            -metadata.delta
+            * self._cache_settings.xfetch_beta
+            * math.log(1.0 - random.random())
+        )
+        return time.time() + early >= metadata.fresh_until
+
+    def _refresh_in_background(
+        self, cache_key: str, refresh: Callable[[], Awaitable[Any]]
+    ) -> None:
+        if cache_key in self._refreshes:
+            return
+        task = asyncio.create_task(self._refresh(refresh))
+        self._refreshes[cache_key] = task
+        task.add_done_callback(lambda _: self._refreshes.pop(cache_key, None))
+
+    @staticmethod
+    async def _refresh(refresh: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            await refresh()
+        except Exception:
+            # The stale value keeps being served until the hard expiry
+            logger.exception("Failed to refresh the cached value")
+
+    async def _read(
+        self, cache_key: str, adapter: TypeAdapter[Any]
+    ) -> CachedValue | None:
         cached_data = await self._cache.get(cache_key)
         if cached_data:
-            return [
-                self._model.model_validate(obj)
-                for obj in json.loads(cached_data)
-            ]
+            # Values written in another format are reloaded and overwritten
+            with contextlib.suppress(CodecError):
+                return CachedValue(
+                    self._cache.loads(cached_data, adapter),
+                    self._cache.metadata(cached_data),
+                )
+        return None
 
-        objs: list[BaseModel] = await self._repository.get_all(**kwargs)
-        if objs is None:
-            return None
-        models = [
-            self._model.model_validate(obj, from_attributes=True)
-            for obj in objs
-        ]
+    async def _write(
+        self, cache_key: str, ttl: CacheTTL, value: Any, delta: float = 0
+    ) -> None:
+        await self._cache.set(
+            cache_key, self._cache.dumps(value, ttl.soft, delta), ttl.hard
+        )
 
-        serializable_data = [
-            self._cache.make_serializable(model.model_dump())
-            for model in models
-        ]
-        await self._cache.set(cache_key, json.dumps(serializable_data))
+    async def _read_page(self, cache_key: str) -> CachedValue | None:
+        cached = await self._read(cache_key, self._uuids_adapter)
+        if cached is None or not cached.value:
+            return cached
+        keys = [await self._get_item_cache_key(uuid) for uuid in cached.value]
+        page = []
+        for cached_data in await self._cache.get_many(keys):
+            # A page with an evicted instance is reloaded as a whole
+            if not cached_data:
+                return None
+            try:
+                item = self._cache.loads(cached_data, self._optional_adapter)
+            except CodecError:
+                return None
+            if item is None:
+                return None
+            page.append(item)
+        return CachedValue(page, cached.metadata)
 
-        return models
+    async def _write_page(
+        self,
+        cache_key: str,
+        params: dict[str, Any],
+        page: list[DBSchemaType],
+        delta: float = 0,
+    ) -> None:
+        item_ttl = self._get_ttl("get")
+        items = {
+            await self._get_item_cache_key(item.uuid): self._cache.dumps(
+                item, item_ttl.soft, delta
+            )
+            for item in page
+        }
+        if items:
+            await self._cache.set_many(items, item_ttl.hard)
+        page_ttl = self._get_ttl("get_all")
+        await self._write(
+            cache_key, page_ttl, [item.uuid for item in page], delta
+        )
+        await self._cache.add_to_index(
+            self._pages_index,
+            cache_key,
+            self._get_page_score(params, page),
+            page_ttl.hard,
+        )
 
-    async def create(self, obj: CreateSchemaType) -> DBSchemaType:
-        obj = await self._repository.create(obj)
-        model = self._model.model_validate(obj, from_attributes=True)
+    @staticmethod
+    def _get_page_score(
+        params: dict[str, Any], page: list[DBSchemaType]
+    ) -> float:
+        """
+        Get the position of the page in the pages index: the creation time of
+        its last instance, or infinity for a page reaching the end of the
+        table.
+
+        The pages are ordered by creation time, so a change of the instance
+        created at T affects only the pages with a score of at least T. A
+        new instance is not always created after the others: its creation
+        time is the start of its transaction, which may commit after newer
+        ones.
+        """
+        if params.get("before"):
+            # Ends right before the instance it seeks from
+            return params["before"][0].timestamp()
+        limit = params.get("limit")
+        if not page or not limit or len(page) < limit:
+            return math.inf
+        return page[-1].created_at.timestamp()
 
-        message = f"Книга {model.title} была создана"
-        async with self._broker as br:
-            await br.publish(message, routing_key="book_queue")
+    async def _invalidate_pages(self, since: datetime) -> None:
+        """
+        Drop the cached pages affected by a change of the instance created at
+        `since`, together with the counts and the page responses embedding
+        them, and warm them up again.
 
+        The instances are written through by the writes themselves, so only
+        the pages are warmed up.
+        """
+        keys = await self._cache.pop_from_index(
+            self._pages_index, since.timestamp()
+        )
+        for name in ("count", "count_estimate"):
+            keys.append(
+                await self._cache.generate_cache_key(
+                    self._service_name, "get_all", name
+                )
+            )
+        await self._cache.delete_many(keys)
         await self._cache.invalidate_cache_with_prefix(
-            self._service_name, "get_all"
+            self._service_name, "get_all_response"
+        )
+        self.schedule_warm_up(pages_only=True)
+
+    async def _write_through(self, model: DBSchemaType) -> None:
+        """
+        Put the committed instance into the cache in place of the old one.
+        """
+        # Deleting first evicts the local copies of the other replicas
+        await self._evict(model.uuid)
+        await self._write(
+            await self._get_item_cache_key(model.uuid),
+            self._get_ttl("get"),
+            model,
         )
 
+    async def _load(
+        self,
+        cache_key: str,
+        loader: Callable[[], Awaitable[Any]],
+        adapter: TypeAdapter[Any],
+        reader: Callable[[], Awaitable[CachedValue | None]],
+        writer: Callable[[Any, float], Awaitable[None]],
+        refresh: bool = False,
+        cache_misses: bool = False,
+    ) -> Any:
+        """
+        Load the data from the repository and put it into the cache.
+
+        Only the replica holding the lease on the key queries the database,
+        the others wait up to `lock_wait` seconds for the key to be filled
+        and load the data themselves only if it does not happen. A background
+        `refresh` is skipped if another replica is already doing it.
+        """
+        token = await self._cache.acquire_lock(
+            cache_key, self._cache_settings.lock_timeout
+        )
+        if token is None:
+            if refresh:
+                return None
+            cached = await self._wait_for_cache(reader)
+            if cached is not None:
+                return cached.value
+        try:
+            started_at = time.monotonic()
+            data = await loader()
+            if data is None:
+                if cache_misses and self._cache_settings.negative_ttl:
+                    await self._write_miss(cache_key)
+                elif refresh:
+                    await self._cache.delete_many([cache_key])
+                return None
+            value = adapter.validate_python(data, from_attributes=True)
+            await writer(value, time.monotonic() - started_at)
+            return value
+        finally:
+            if token is not None:
+                await self._cache.release_lock(cache_key, token)
+
+    async def _wait_for_cache(
+        self, reader: Callable[[], Awaitable[CachedValue | None]]
+    ) -> CachedValue | None:
+        deadline = time.monotonic() + self._cache_settings.lock_wait
+        while time.monotonic() < deadline:
+            await asyncio.sleep(LOCK_POLL_INTERVAL)
+            cached = await reader()
+            if cached is not None:
+                return cached
+        return None
+
+    async def _write_miss(self, cache_key: str) -> None:
+        """
+        Cache a tombstone: the instance does not exist.
+        """
+        await self._cache.set(
+            cache_key,
+            self._cache.dumps(None),
+            self._cache_settings.negative_ttl,
+        )
+
+    async def _evict(self, obj_uuid: UUID) -> None:
+        """
+        Delete the cached instance and its serialized response.
+        """
+        await self._cache.delete_many(
+            [
+                await self._get_item_cache_key(obj_uuid),
+                await self.get_response_cache_key("get", str(obj_uuid)),
+            ]
+        )
+
+    def _event(
+        self, change: Change, changed_fields: Iterable[str] | None = None
+    ) -> EventFactory | None:
+        """
+        Get the factory of the change event, written to the outbox in the
+        transaction of the change, or None if the service has no events.
+
+        Args:
+            change: The kind of the change.
+            changed_fields: The fields set by the change, None for all.
+        """
+        return None
+
+    def _notify_outbox(self) -> None:
+        if self._outbox is not None:
+            self._outbox.notify()
+
+    async def create(self, obj: CreateSchemaType) -> DBSchemaType:
+        obj = await self._repository.create(obj, event=self._event("created"))
+        model = self._model.model_validate(obj, from_attributes=True)
+        self._notify_outbox()
+
+        # Replaces a tombstone cached for the UUID on every replica
+        await self._write_through(model)
+        await self._invalidate_pages(since=model.created_at)
+
         return model
 
     async def update(
         self, obj_uuid: UUID, obj: UpdateSchemaType
-    ) -> DBSchemaType:
-        obj = await self._repository.update(obj_uuid, obj)
+    ) -> DBSchemaType | None:
+        obj = await self._repository.update(
+            obj_uuid,
+            obj,
+            event=self._event("updated", sorted(obj.model_fields_set)),
+        )
+        if obj is None:
+            return None
         model = self._model.model_validate(obj, from_attributes=True)
+        self._notify_outbox()
 
-        message = f"Книга {model.title} была обновлена"
-        async with self._broker as br:
-            await br.publish(message, routing_key="book_queue")
-
+        # The pages hold only the UUIDs, so they stay valid, only the page
+        # responses embedding the instance are dropped
+        await self._write_through(model)
         await self._cache.invalidate_cache_with_prefix(
-            self._service_name, "get_all"
+            self._service_name, "get_all_response"
         )
 
         return model
 
     async def remove(self, obj_uuid: UUID) -> UUID:
-        obj_uuid = await self._repository.remove(obj_uuid)
+        instance = await self._get(obj_uuid)
+        obj_uuid = await self._repository.remove(
+            obj_uuid, event=self._event("deleted", ())
+        )
+        self._notify_outbox()
 
-        message = f"Книга с id {obj_uuid} была удалена"
-        async with self._broker as br:
-            await br.publish(message, routing_key="book_queue")
+        await self._evict(obj_uuid)
+        if self._cache_settings.negative_ttl:
+            await self._write_miss(await self._get_item_cache_key(obj_uuid))
+        if instance is not None:
+            await self._invalidate_pages(since=instance.created_at)
 
-        await self._cache.invalidate_cache_with_prefix(
-            self._service_name, "get_all"
+        return obj_uuid
+
+    async def count(self, **kwargs) -> int | None:
+        cache_key = await self._cache.generate_cache_key(
+            self._service_name, "get_all", "count"
+        )
+        return await self._get_or_load(
+            cache_key, self._repository.count, self._count_adapter, "count"
         )
 
-        return obj_uuid
+    async def count_estimate(self) -> int | None:
+        """
+        Get the planner estimate of the number of rows.
 
-    async def count(self) -> int | None:
-        count = await self._repository.count()
-        return count
+        Returns None when the estimate is below the configured threshold
+        (or the table was never analyzed) and an exact count is cheap enough.
+        """
+        cache_key = await self._cache.generate_cache_key(
+            self._service_name, "get_all", "count_estimate"
+        )
+        estimate = await self._get_or_load(
+            cache_key,
+            self._repository.count_estimate,
+            self._count_adapter,
+            "count_estimate",
+        )
+        if (
+            estimate is None
+            or estimate < settings.pagination.approximate_count_threshold
+        ):
+            return None
+        return estimate
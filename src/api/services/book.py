@@ -1,19 +1,33 @@
+from collections.abc import Iterable
 from functools import lru_cache
+from typing import Any
+from uuid import UUID
 
 from fastapi import Depends
-from faststream.rabbit import RabbitBroker
 
-from src.api.brokers.rabbitmq import get_rabbit_broker
+from src.api.brokers import events
+from src.api.brokers.events_pb2 import BookEvent
 from src.api.schemas.api.v1.books import (
     RequestBookCreate,
     RequestBookUpdate,
     ResponseBooksPaginated,
 )
 from src.api.schemas.db.book import BookDB
-from src.api.services.base import BaseService
-from src.cache.redis import RedisCache, get_redis
+from src.api.schemas.db.outbox import OutboxMessage
+from src.api.services.base import BaseService, Change
+from src.api.services.outbox import OutboxRelay, get_outbox_relay
+from src.cache.abstract import AbstractCache
+from src.cache.tiered import get_tiered_cache
+from src.configs import settings
+from src.db.repositories.abstract import EventFactory
 from src.db.repositories.book import BookRepository, get_book_repository
 
+EVENT_TYPES = {
+    "created": BookEvent.CREATED,
+    "updated": BookEvent.UPDATED,
+    "deleted": BookEvent.DELETED,
+}
+
 
 class BookService(
     BaseService[
@@ -23,13 +37,101 @@ class BookService(
         RequestBookUpdate,
     ]
 ):
-    pass
+    def _event(
+        self, change: Change, changed_fields: Iterable[str] | None = None
+    ) -> EventFactory:
+        """
+        Get the factory of the BookEvent published to the fanout exchange of
+        the events.
+        """
+        event_type = EVENT_TYPES[change]
+        if changed_fields is None:
+            changed_fields = events.BOOK_FIELDS
+
+        def build(db_obj: Any) -> OutboxMessage:
+            return OutboxMessage(
+                exchange=settings.rabbit.events_exchange,
+                routing_key="",
+                payload=events.encode_book_event(
+                    event_type, db_obj, changed_fields
+                ),
+                content_type=events.CONTENT_TYPE,
+            )
+
+        return build
+
+    async def apply_event(self, event: BookEvent) -> None:
+        """
+        Bring the caches in line with a change event of any replica.
+
+        The local copies of the instance and of the pages are always
+        dropped. The shared cache is changed only while it still holds the
+        instance as it was before the change, that is when the writer did
+        not get to update it, so it is updated once and not by every
+        replica. Events whose version is not newer than the one of the
+        cached instance are ignored, the versions are bumped by the database
+        on every change, so the order does not depend on the clocks.
+
+        A creation finding a tombstone replaces it with the instance, unless
+        the instance was removed since.
+        """
+        obj_uuid = UUID(event.book_uuid)
+        item_key = await self._get_item_cache_key(obj_uuid)
+        response_key = await self.get_response_cache_key("get", str(obj_uuid))
+        namespaces = [f"{self._service_name}:get_all_response"]
+        if event.type != BookEvent.UPDATED:
+            namespaces.append(f"{self._service_name}:get_all")
+        self._cache.evict_local([item_key, response_key], namespaces)
+
+        model = self._model.model_validate(events.book_event_fields(event))
+        cached = await self._read(item_key, self._optional_adapter)
+        if (
+            cached is not None
+            and cached.value is None
+            and event.type == BookEvent.CREATED
+        ):
+            await self._replace_tombstone(obj_uuid, model)
+            return
+        # Not cached, nothing is stale. A tombstone means the instance was
+        # removed, or, for a removal, that it is applied already
+        if cached is None or cached.value is None:
+            return
+        if event.type == BookEvent.DELETED:
+            await self._evict(obj_uuid)
+            if self._cache_settings.negative_ttl:
+                await self._write_miss(item_key)
+            await self._invalidate_pages(since=model.created_at)
+        elif cached.value.version < model.version:
+            await self._write_through(model)
+            if event.type == BookEvent.CREATED:
+                await self._invalidate_pages(since=model.created_at)
+            else:
+                await self._cache.invalidate_cache_with_prefix(
+                    self._service_name, "get_all_response"
+                )
+
+    async def _replace_tombstone(self, obj_uuid: UUID, model: BookDB) -> None:
+        """
+        Replace the tombstone cached by a lookup that missed the instance
+        before its creation was committed.
+
+        The tombstones carry no version, so a tombstone of a later removal
+        looks the same: the instance is read from the database, where it is
+        no more if it was removed, at its latest version otherwise.
+        """
+        obj = await self._repository.get(obj_uuid)
+        if obj is None:
+            return
+        await self._write_through(
+            self._model.model_validate(obj, from_attributes=True)
+        )
+        await self._invalidate_pages(since=model.created_at)
 
 
 @lru_cache
 def get_book_service(
     repository: BookRepository = Depends(get_book_repository),
-    cache: RedisCache = Depends(get_redis),
-    broker: RabbitBroker = Depends(get_rabbit_broker),
+    cache: AbstractCache = Depends(get_tiered_cache),
+    outbox: OutboxRelay | None = Depends(get_outbox_relay),
 ) -> BookService:
-    return BookService(repository, BookDB, cache, broker)
+    return BookService(repository, BookDB, cache, outbox)
@@ -0,0 +1,150 @@
+import asyncio
+import contextlib
+import logging
+
+from sqlalchemy import delete, select
+
+from src.api.brokers.rabbitmq import EventPublisher, Message, event_publisher
+from src.configs import OutboxSettings, settings
+from src.db.clients.postgres import PostgresDatabase
+from src.db.entities import Outbox
+
+logger = logging.getLogger("OutboxRelay")
+
+
+class OutboxRelay:
+    """
+    Publishes the events of the outbox table to the broker.
+
+    Every round locks a batch of the oldest events with FOR UPDATE SKIP
+    LOCKED, so any number of relays, in the API workers or in separate
+    processes, share the outbox without publishing an event twice. The batch
+    is published in one confirm round and the confirmed events are deleted in
+    the same transaction, the others stay in the outbox and are retried.
+    """
+
+    def __init__(
+        self,
+        database: PostgresDatabase,
+        publisher: EventPublisher,
+        settings: OutboxSettings,
+    ):
+        self.__database = database
+        self.__publisher = publisher
+        self.__batch_size = settings.batch_size
+        self.__poll_interval = settings.poll_interval
+        self.__wakeup = asyncio.Event()
+        self.__task: asyncio.Task[None] | None = None
+        self.relayed = 0
+        self.failed = 0
+
+    async def start(self) -> None:
+        """
+        Start relaying the events in the background.
+        """
+        self.__task = asyncio.create_task(self.run())
+
+    async def close(self) -> None:
+        if self.__task is not None:
+            self.__task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self.__task
+            self.__task = None
+
+    def notify(self) -> None:
+        """
+        Wake the relay up, an event was just written to the outbox.
+        """
+        self.__wakeup.set()
+
+    async def run(self) -> None:
+        """
+        Relay the events until cancelled, polling the outbox every
+        `poll_interval` seconds when it is drained.
+        """
+        while True:
+            try:
+                relayed = await self.relay()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Failed to relay the outbox events")
+                relayed = 0
+            if relayed < self.__batch_size:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        self.__wakeup.wait(), self.__poll_interval
+                    )
+                self.__wakeup.clear()
+
+    async def relay(self) -> int:
+        """
+        Publish one batch of the outbox events.
+
+        Returns:
+            int: The number of the published events.
+        """
+        async with self.__database.get_session() as session:
+            db_obj = await session.execute(
+                select(Outbox)
+                .order_by(Outbox.created_at)
+                .limit(self.__batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            events = db_obj.scalars().all()
+            if not events:
+                return 0
+            errors = await self.__publisher.publish_batch(
+                [
+                    Message(
+                        event.payload,
+                        event.routing_key,
+                        event.content_type,
+                        event.exchange,
+                    )
+                    for event in events
+                ]
+            )
+            published = [
+                event.uuid
+                for event, error in zip(events, errors)
+                if error is None
+            ]
+            if published:
+                await session.execute(
+                    delete(Outbox).where(Outbox.uuid.in_(published))
+                )
+            await session.commit()
+        failed = len(events) - len(published)
+        if failed:
+            logger.warning("%d outbox events were not confirmed", failed)
+        self.relayed += len(published)
+        self.failed += failed
+        return len(published)
+
+    def stats(self) -> dict[str, int]:
+        return {"relayed": self.relayed, "failed": self.failed}
+
+
+outbox_relay: OutboxRelay | None = None
+
+
+async def get_outbox_relay() -> OutboxRelay | None:
+    return outbox_relay
+
+
+async def main() -> None:
+    """
+    Run the relay as a standalone worker process.
+    """
+    database = PostgresDatabase(settings.postgres)
+    await event_publisher.start()
+    try:
+        await OutboxRelay(database, event_publisher, settings.outbox).run()
+    finally:
+        await event_publisher.close()
+        await database.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
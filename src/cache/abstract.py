@@ -1,13 +1,17 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
+from pydantic import TypeAdapter
+
+from src.cache.codecs import CacheMetadata
+
 
 class AbstractCache(ABC):
     @abstractmethod
     async def set(
         self,
         key: str,
-        value: str,
+        value: str | bytes,
         expire: int = 600,
     ) -> None:
         """
@@ -15,7 +19,7 @@ class AbstractCache(ABC):
 
         Args:
             key (str): The key to use for caching the data.
-            value (str): The data to cache.
+            value (str | bytes): The data to cache.
             expire (int): time for data expiration
         """
         raise NotImplementedError
@@ -34,12 +38,93 @@ class AbstractCache(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def generate_cache_key(
+    async def get_many(self, keys: list[str]) -> list[Any]:
+        """
+        Get several values from the cache in one round trip.
+
+        Args:
+            keys (list[str]): The keys used for caching the data.
+
+        Returns:
+            The cached values in the order of the keys, None for the misses.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set_many(
+        self, mapping: dict[str, str | bytes], expire: int = 600
+    ) -> None:
+        """
+        Set several values in the cache in one round trip.
+
+        Args:
+            mapping (dict): The data to cache by the key to use.
+            expire (int): time for data expiration
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_many(self, keys: list[str]) -> None:
+        """
+        Delete several values from the cache in one round trip.
+
+        Args:
+            keys (list[str]): The keys to delete.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def evict_local(
+        self, keys: list[str], namespaces: list[str] | None = None
+    ) -> None:
+        """
+        Drop the in-process copies of the keys and of the namespaces,
+        leaving the shared cache intact.
+
+        Args:
+            keys (list[str]): The keys to drop.
+            namespaces (list[str]): The "service:method" namespaces to drop.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def add_to_index(
+        self, index: str, key: str, score: float, expire: int = 600
+    ) -> None:
+        """
+        Register a cache key in an index ordered by score.
+
+        Args:
+            index (str): The name of the index.
+            key (str): The cache key to register.
+            score (float): The position of the key in the index.
+            expire (int): time for index expiration
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def pop_from_index(self, index: str, min_score: float) -> list[str]:
+        """
+        Atomically remove and return the keys with a score of at least
+        `min_score` from the index.
+
+        Args:
+            index (str): The name of the index.
+            min_score (float): The lowest score of the keys to pop.
+
+        Returns:
+            The popped cache keys.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def generate_cache_key(
         self, service_name: str, method_name: str, *args: Any, **kwargs: Any
     ) -> str:
         """
         Generate a unique key for the cache based on the service name (class name),
-        method name and passed parameters.
+        method name, the current generation of the service_name:method_name
+        namespace and passed parameters.
 
         Args:
             service_name (str): The name of the service to build key.
@@ -52,12 +137,45 @@ class AbstractCache(ABC):
         """
         raise NotImplementedError
 
-    @staticmethod
     @abstractmethod
-    def make_serializable(data: Any) -> Any:
+    def dumps(self, data: Any, fresh_for: float = 0, delta: float = 0) -> bytes:
         """
-        Recursively converts UUID and datetime objects to strings.
-        Supports conversion of dictionaries, lists, and nested data structures.
+        Encode the data to be stored in the cache with the configured codec.
+        UUID and datetime values, pydantic models and their lists are
+        supported.
+
+        Args:
+            data (Any): The data to encode.
+            fresh_for (float): Seconds the value stays fresh (soft TTL),
+                0 to keep it fresh until it expires.
+            delta (float): Seconds it took to compute the value.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def metadata(self, data: bytes) -> CacheMetadata:
+        """
+        Get the freshness metadata stored along with the cached data.
+
+        Raises:
+            CodecError: The data was written by another format version or
+                codec, and should be treated as missing.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def loads(self, data: bytes, adapter: TypeAdapter[Any]) -> Any:
+        """
+        Decode and validate the cached data with the configured codec.
+
+        Args:
+            data (bytes): The cached data.
+            adapter (TypeAdapter): The type the data is validated against.
+
+        Raises:
+            CodecError: The data was written by another format version or
+                codec, is corrupt or does not match the type, and should be
+                treated as missing.
         """
         raise NotImplementedError
 
@@ -66,10 +184,47 @@ class AbstractCache(ABC):
         self, service_name: str, method_name: str
     ):
         """
-        Function to remove all cached values ​​with a certain prefix
+        Function to invalidate all cached values with a certain prefix.
+        The generation of the namespace is bumped, so the keys generated
+        afterwards never match the old entries, which age out by their TTL.
 
         Args:
             service_name (str): prefix first part
             method_name (str): prefix second part
         """
         raise NotImplementedError
+
+    @abstractmethod
+    async def acquire_lock(self, key: str, timeout: float) -> str | None:
+        """
+        Try to take a short lease on the key, shared by all the replicas.
+
+        Args:
+            key (str): The cache key to lock.
+            timeout (float): Lease lifetime in seconds.
+
+        Returns:
+            The lease token if the lock was taken, otherwise None.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def release_lock(self, key: str, token: str) -> None:
+        """
+        Release the lease taken by `acquire_lock` if it is still held.
+
+        Args:
+            key (str): The locked cache key.
+            token (str): The lease token returned by `acquire_lock`.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the cache usage counters (hits, misses, evictions).
+
+        Returns:
+            dict: Counters of the cache, grouped by tier if there are several.
+        """
+        raise NotImplementedError
@@ -0,0 +1,225 @@
+import importlib.util
+import json
+import struct
+import time
+import zlib
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import Any, NamedTuple
+from uuid import UUID
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+
+FORMAT_VERSION = 2
+FLAG_COMPRESSED = 0b0000_0001
+# version, serializer id, flags, fresh until (unix time), recompute time
+HEADER = struct.Struct(">BBBdf")
+
+
+class CodecError(ValueError):
+    """
+    The cached value was written in an unsupported format, is corrupt or no
+    longer matches the schema.
+    """
+
+
+class CacheMetadata(NamedTuple):
+    """
+    Freshness of a cached value: the time it becomes stale (0 if it never
+    does before the hard expiry) and how long it took to compute, in
+    seconds.
+    """
+
+    fresh_until: float
+    delta: float
+
+
+def to_primitive(data: Any) -> Any:
+    """
+    Fallback for the serializers which do not know the application types.
+    """
+    match data:
+        case BaseModel():
+            return data.model_dump()
+        case UUID():
+            return str(data)
+        case datetime() | date():
+            return data.isoformat()
+        case _:
+            raise TypeError(f"Type {type(data)} is not serializable")
+
+
+class Serializer(ABC):
+    serializer_id: int
+    name: str
+    # Package the serializer needs, None if it only needs the dependencies
+    # of the application
+    package: str | None = None
+
+    @abstractmethod
+    def dumps(self, data: Any) -> bytes:
+        raise NotImplementedError
+
+    @abstractmethod
+    def loads(self, data: bytes, adapter: TypeAdapter[Any]) -> Any:
+        raise NotImplementedError
+
+
+class PydanticSerializer(Serializer):
+    """
+    JSON serializer of pydantic-core: models are validated straight from
+    the JSON bytes, without building intermediate dictionaries.
+    """
+
+    serializer_id = 1
+    name = "pydantic"
+
+    def dumps(self, data: Any) -> bytes:
+        return to_json(data)
+
+    def loads(self, data: bytes, adapter: TypeAdapter[Any]) -> Any:
+        return adapter.validate_json(data)
+
+
+class OrjsonSerializer(Serializer):
+    serializer_id = 2
+    name = "orjson"
+    package = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self.__orjson = orjson
+
+    def dumps(self, data: Any) -> bytes:
+        return self.__orjson.dumps(data, default=to_primitive)
+
+    def loads(self, data: bytes, adapter: TypeAdapter[Any]) -> Any:
+        return adapter.validate_python(self.__orjson.loads(data))
+
+
+class MsgpackSerializer(Serializer):
+    serializer_id = 3
+    name = "msgpack"
+    package = "msgpack"
+
+    def __init__(self) -> None:
+        import msgpack
+
+        self.__msgpack = msgpack
+
+    def dumps(self, data: Any) -> bytes:
+        return self.__msgpack.packb(data, default=to_primitive)
+
+    def loads(self, data: bytes, adapter: TypeAdapter[Any]) -> Any:
+        return adapter.validate_python(self.__msgpack.unpackb(data))
+
+
+class JsonSerializer(Serializer):
+    serializer_id = 4
+    name = "json"
+
+    def dumps(self, data: Any) -> bytes:
+        return json.dumps(data, default=to_primitive).encode()
+
+    def loads(self, data: bytes, adapter: TypeAdapter[Any]) -> Any:
+        return adapter.validate_python(json.loads(data))
+
+
+SERIALIZERS: dict[str, type[Serializer]] = {
+    serializer.name: serializer
+    for serializer in (
+        PydanticSerializer,
+        OrjsonSerializer,
+        MsgpackSerializer,
+        JsonSerializer,
+    )
+}
+
+
+class CacheCodec:
+    """
+    Encodes cached values as a small header followed by the payload.
+
+    The header holds the format version, the serializer id, the flags
+    (whether the payload is zlib compressed) and the freshness metadata, so
+    values written by another version or with another serializer are
+    recognized and treated as misses.
+    """
+
+    def __init__(self, serializer: Serializer, compress_threshold: int = 0):
+        self.__serializer = serializer
+        self.__compress_threshold = compress_threshold
+
+    @property
+    def name(self) -> str:
+        return self.__serializer.name
+
+    def dumps(self, data: Any, fresh_for: float = 0, delta: float = 0) -> bytes:
+        payload = self.__serializer.dumps(data)
+        flags = 0
+        if 0 < self.__compress_threshold <= len(payload):
+            payload = zlib.compress(payload, 1)
+            flags |= FLAG_COMPRESSED
+        fresh_until = time.time() + fresh_for if fresh_for > 0 else 0.0
+        header = HEADER.pack(
+            FORMAT_VERSION,
+            self.__serializer.serializer_id,
+            flags,
+            fresh_until,
+            delta,
+        )
+        return header + payload
+
+    def _unpack_header(self, data: bytes) -> tuple[int, CacheMetadata]:
+        if (
+            len(data) < HEADER.size
+            or data[0] != FORMAT_VERSION
+            or data[1] != self.__serializer.serializer_id
+        ):
+            raise CodecError("Unsupported cache value format")
+        _, _, flags, fresh_until, delta = HEADER.unpack_from(data)
+        return flags, CacheMetadata(fresh_until, delta)
+
+    def metadata(self, data: bytes) -> CacheMetadata:
+        return self._unpack_header(data)[1]
+
+    def loads(self, data: bytes, adapter: TypeAdapter[Any]) -> Any:
+        flags, _ = self._unpack_header(data)
+        payload = data[HEADER.size :]
+        try:
+            if flags & FLAG_COMPRESSED:
+                payload = zlib.decompress(payload)
+            return self.__serializer.loads(payload, adapter)
+        except (zlib.error, ValueError, TypeError) as e:
+            # The decode errors of the serializers and the validation errors
+            # are ValueError, the value is reloaded like an unsupported one
+            raise CodecError(f"Undecodable cache value: {e}") from e
+
+
+def check_serializer(name: str) -> type[Serializer]:
+    """
+    Raises:
+        ValueError: The serializer is unknown or its package is not installed.
+    """
+    serializer = SERIALIZERS.get(name)
+    if serializer is None:
+        raise ValueError(f"Unknown cache codec {name!r}")
+    if (
+        serializer.package is not None
+        and importlib.util.find_spec(serializer.package) is None
+    ):
+        raise ValueError(
+            f"Cache codec {name!r} requires the {serializer.package!r} "
+            "package, install it or choose another CACHE_CODEC"
+        )
+    return serializer
+
+
+def get_codec(name: str, compress_threshold: int = 0) -> CacheCodec:
+    """
+    Raises:
+        ValueError: The serializer is unknown or its package is not installed.
+    """
+    return CacheCodec(check_serializer(name)(), compress_threshold)
@@ -0,0 +1,85 @@
+import sys
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+class LocalCache:
+    """
+    Bounded in-process LRU cache with a per-entry TTL.
+
+    The size is limited both by the number of entries and by the total size
+    of the stored values in bytes; the least recently used entries are
+    evicted first when either limit is exceeded.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.__max_entries = max_entries
+        self.__max_bytes = max_bytes
+        self.__entries: OrderedDict[str, tuple[Any, float, int]] = OrderedDict()
+        self.__bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def _sizeof(value: Any) -> int:
+        if isinstance(value, str | bytes):
+            return len(value)
+        return sys.getsizeof(value)
+
+    def get(self, key: str) -> Any:
+        entry = self.__entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        value, expires_at, _ = entry
+        if expires_at <= time.monotonic():
+            self._pop(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self.__entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, expire: int) -> None:
+        size = self._sizeof(value)
+        if not self.__max_entries or size > self.__max_bytes:
+            return
+        self._pop(key)
+        self.__entries[key] = (value, time.monotonic() + expire, size)
+        self.__bytes += size
+        while (
+            len(self.__entries) > self.__max_entries
+            or self.__bytes > self.__max_bytes
+        ):
+            self._pop(next(iter(self.__entries)))
+            self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        self._pop(key)
+
+    def delete_prefix(self, prefix: str) -> None:
+        for key in [key for key in self.__entries if key.startswith(prefix)]:
+            self._pop(key)
+
+    def clear(self) -> None:
+        self.__entries.clear()
+        self.__bytes = 0
+
+    def _pop(self, key: str) -> None:
+        entry = self.__entries.pop(key, None)
+        if entry is not None:
+            self.__bytes -= entry[2]
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self.__entries),
+            "bytes": self.__bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
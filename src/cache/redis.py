@@ -1,19 +1,41 @@
 import logging
-from datetime import datetime
+import time
+from collections.abc import AsyncIterator
 from typing import Any
-from uuid import UUID
+from uuid import uuid4
 
+from pydantic import TypeAdapter
 from redis.asyncio import Redis
 
 from src.cache.abstract import AbstractCache
+from src.cache.codecs import CacheCodec, CacheMetadata, PydanticSerializer
 from src.utils.retry_decorator import retry
 
 logger = logging.getLogger("RedisCache")
 
+PUBSUB_POLL_INTERVAL = 1.0
+
+RELEASE_LOCK_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
 
 class RedisCache(AbstractCache):
-    def __init__(self, cache: Redis):
+    def __init__(
+        self,
+        cache: Redis,
+        generation_ttl: float = 1.0,
+        codec: CacheCodec | None = None,
+    ):
         self.__cache = cache
+        self.__codec = codec or CacheCodec(PydanticSerializer())
+        self.__generation_ttl = generation_ttl
+        self.__generations: dict[str, tuple[int, float]] = {}
+        self.hits = 0
+        self.misses = 0
 
     async def close(self) -> None:
         """
@@ -31,52 +53,190 @@ class RedisCache(AbstractCache):
 
     @retry(exceptions=(ConnectionError,))
     async def get(self, key: str):
-        return await self.__cache.get(key)
+        value = await self.__cache.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
 
     @retry(exceptions=(ConnectionError,))
-    async def set(self, key: str, value: str, expire: int = 600):
+    async def set(self, key: str, value: str | bytes, expire: int = 600):
         await self.__cache.set(key, value, expire)
 
-    def generate_cache_key(
+    @retry(exceptions=(ConnectionError,))
+    async def get_many(self, keys: list[str]) -> list[Any]:
+        if not keys:
+            return []
+        values = await self.__cache.mget(keys)
+        hits = sum(value is not None for value in values)
+        self.hits += hits
+        self.misses += len(values) - hits
+        return values
+
+    @retry(exceptions=(ConnectionError,))
+    async def set_many(
+        self, mapping: dict[str, str | bytes], expire: int = 600
+    ) -> None:
+        if not mapping:
+            return
+        async with self.__cache.pipeline(transaction=False) as pipe:
+            for key, value in mapping.items():
+                pipe.set(key, value, ex=expire)
+            await pipe.execute()
+
+    @retry(exceptions=(ConnectionError,))
+    async def delete_many(self, keys: list[str]) -> None:
+        if keys:
+            await self.__cache.delete(*keys)
+
+    def evict_local(
+        self, keys: list[str], namespaces: list[str] | None = None
+    ) -> None:
+        # Nothing is kept in process, apart from the namespace generations
+        for namespace in namespaces or []:
+            self.forget_generation(namespace)
+
+    @retry(exceptions=(ConnectionError,))
+    async def add_to_index(
+        self, index: str, key: str, score: float, expire: int = 600
+    ) -> None:
+        async with self.__cache.pipeline(transaction=False) as pipe:
+            pipe.zadd(f"index:{index}", {key: score})
+            pipe.expire(f"index:{index}", expire)
+            await pipe.execute()
+
+    @retry(exceptions=(ConnectionError,))
+    async def pop_from_index(self, index: str, min_score: float) -> list[str]:
+        async with self.__cache.pipeline(transaction=True) as pipe:
+            pipe.zrangebyscore(f"index:{index}", min_score, "+inf")
+            pipe.zremrangebyscore(f"index:{index}", min_score, "+inf")
+            keys, _ = await pipe.execute()
+        return [key.decode() if isinstance(key, bytes) else key for key in keys]
+
+    @staticmethod
+    def _generation_key(namespace: str) -> str:
+        return f"generation:{namespace}"
+
+    @staticmethod
+    def _generation_seed() -> int:
+        # Microseconds since the epoch: a generation lost by a flush or an
+        # eviction starts again above every value it had before, so the keys
+        # of the old entries, still in L1 or in Redis, are never built again
+        return time.time_ns() // 1000
+
+    @retry(exceptions=(ConnectionError,))
+    async def get_generation(self, namespace: str) -> int:
+        """
+        Get the current generation of the namespace.
+
+        The value is kept in process memory for `generation_ttl` seconds,
+        so Redis is asked at most once per that interval per namespace.
+        """
+        cached = self.__generations.get(namespace)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+        key = self._generation_key(namespace)
+        value = await self.__cache.get(key)
+        if value is None:
+            async with self.__cache.pipeline(transaction=False) as pipe:
+                pipe.set(key, self._generation_seed(), nx=True)
+                pipe.get(key)
+                _, value = await pipe.execute()
+        generation = int(value)
+        self.__generations[namespace] = (
+            generation,
+            time.monotonic() + self.__generation_ttl,
+        )
+        return generation
+
+    def forget_generation(self, namespace: str) -> None:
+        """
+        Drop the locally remembered generation of the namespace.
+        """
+        self.__generations.pop(namespace, None)
+
+    def forget_generations(self) -> None:
+        """
+        Drop all the locally remembered generations.
+        """
+        self.__generations.clear()
+
+    async def generate_cache_key(
         self, service_name: str, method_name: str, *args: Any, **kwargs: Any
     ) -> str:
-        key = f"{service_name}:{method_name}:"
+        namespace = f"{service_name}:{method_name}"
+        generation = await self.get_generation(namespace)
+        key = f"{namespace}:{generation}:"
         if args:
             key += ":".join(str(arg) for arg in args)
         if kwargs:
             key += ":" + ":".join(f"{k}={v}" for k, v in kwargs.items())
         return key
 
-    @staticmethod
-    def make_serializable(data: Any) -> Any:
-        match data:
-            case dict():
-                return {
-                    key: RedisCache.make_serializable(value)
-                    for key, value in data.items()
-                }
-            case list():
-                return [RedisCache.make_serializable(item) for item in data]
-            case UUID():
-                return str(data)
-            case datetime():
-                return data.isoformat()
-            case _:
-                return data
+    def dumps(self, data: Any, fresh_for: float = 0, delta: float = 0) -> bytes:
+        return self.__codec.dumps(data, fresh_for, delta)
+
+    def metadata(self, data: bytes) -> CacheMetadata:
+        return self.__codec.metadata(data)
+
+    def loads(self, data: bytes, adapter: TypeAdapter[Any]) -> Any:
+        return self.__codec.loads(data, adapter)
 
+    @retry(exceptions=(ConnectionError,))
     async def invalidate_cache_with_prefix(
         self, service_name: str, method_name: str
     ):
-        key_pattern = f"{service_name}:{method_name}:*"
-        cursor = 0
-        while True:
-            cursor, keys = await self.__cache.scan(
-                cursor=cursor, match=key_pattern, count=100
-            )
-            if keys:
-                await self.__cache.delete(*keys)
-            if cursor == 0:
-                break
+        namespace = f"{service_name}:{method_name}"
+        key = self._generation_key(namespace)
+        async with self.__cache.pipeline(transaction=True) as pipe:
+            pipe.set(key, self._generation_seed(), nx=True)
+            pipe.incr(key)
+            _, generation = await pipe.execute()
+        self.__generations[namespace] = (
+            generation,
+            time.monotonic() + self.__generation_ttl,
+        )
+
+    @retry(exceptions=(ConnectionError,))
+    async def publish(self, channel: str, message: str) -> None:
+        """
+        Publish a message to every subscriber of the channel.
+        """
+        await self.__cache.publish(channel, message)
+
+    async def subscribe(self, channel: str) -> AsyncIterator[str]:
+        """
+        Yield the messages published to the channel until cancelled.
+        """
+        async with self.__cache.pubsub() as pubsub:
+            await pubsub.subscribe(channel)
+            while True:
+                # Polls with a timeout below the socket timeout, so an idle
+                # channel is not taken for a dead connection
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=PUBSUB_POLL_INTERVAL,
+                )
+                if message is None or message["type"] != "message":
+                    continue
+                data = message["data"]
+                yield data.decode() if isinstance(data, bytes) else data
+
+    @retry(exceptions=(ConnectionError,))
+    async def acquire_lock(self, key: str, timeout: float) -> str | None:
+        token = uuid4().hex
+        acquired = await self.__cache.set(
+            f"lock:{key}", token, px=int(timeout * 1000), nx=True
+        )
+        return token if acquired else None
+
+    @retry(exceptions=(ConnectionError,))
+    async def release_lock(self, key: str, token: str) -> None:
+        await self.__cache.eval(RELEASE_LOCK_SCRIPT, 1, f"lock:{key}", token)
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
 
 
 redis: RedisCache | None = None
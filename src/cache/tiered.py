@@ -0,0 +1,183 @@
+import asyncio
+import contextlib
+import json
+import logging
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from src.cache.abstract import AbstractCache
+from src.cache.codecs import CacheMetadata
+from src.cache.memory import LocalCache
+from src.cache.redis import RedisCache
+from src.configs import CacheSettings
+
+logger = logging.getLogger("TieredCache")
+
+
+class TieredCache(AbstractCache):
+    """
+    Two-tier cache: an in-process LRU (L1) in front of the shared Redis (L2).
+
+    Prefix invalidations and key deletions are published over Redis pub/sub,
+    so the L1 copies of every API replica are evicted, not only the local
+    ones.
+    """
+
+    def __init__(self, remote: RedisCache, settings: CacheSettings):
+        self.__remote = remote
+        self.__local = LocalCache(
+            settings.local_max_entries, settings.local_max_bytes
+        )
+        self.__local_ttl = settings.local_ttl
+        self.__channel = settings.invalidation_channel
+        self.__listener: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """
+        Start listening for invalidations published by the other replicas.
+        """
+        self.__listener = asyncio.create_task(self._listen())
+
+    async def close(self) -> None:
+        """
+        Stop the invalidation listener and close the connection with Redis.
+        """
+        if self.__listener is not None:
+            self.__listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self.__listener
+        self.__local.clear()
+        await self.__remote.close()
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async for message in self.__remote.subscribe(self.__channel):
+                    self._evict(json.loads(message))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Invalidation listener failed, restarting")
+                # Entries published while disconnected may have been missed
+                self.__local.clear()
+                await asyncio.sleep(1)
+
+    def _evict(self, message: dict[str, Any]) -> None:
+        if message.get("flush"):
+            # The shared cache was flushed, the generations are seeded again
+            self.__remote.forget_generations()
+            self.__local.clear()
+        for namespace in message.get("namespaces", []):
+            self.__remote.forget_generation(namespace)
+            self.__local.delete_prefix(f"{namespace}:")
+        for key in message.get("keys", []):
+            self.__local.delete(key)
+
+    async def _publish(
+        self, namespaces: list[str] | None = None, keys: list[str] | None = None
+    ) -> None:
+        await self.__remote.publish(
+            self.__channel,
+            json.dumps({"namespaces": namespaces or [], "keys": keys or []}),
+        )
+
+    async def get(self, key: str):
+        value = self.__local.get(key)
+        if value is not None:
+            return value
+        value = await self.__remote.get(key)
+        if value is not None:
+            self.__local.set(key, value, self.__local_ttl)
+        return value
+
+    async def set(self, key: str, value: str | bytes, expire: int = 600):
+        await self.__remote.set(key, value, expire)
+        self.__local.set(key, value, min(expire, self.__local_ttl))
+
+    async def get_many(self, keys: list[str]) -> list[Any]:
+        values = [self.__local.get(key) for key in keys]
+        missing = [key for key, value in zip(keys, values) if value is None]
+        if not missing:
+            return values
+        fetched = dict(zip(missing, await self.__remote.get_many(missing)))
+        for key, value in fetched.items():
+            if value is not None:
+                self.__local.set(key, value, self.__local_ttl)
+        return [
+            value if value is not None else fetched[key]
+            for key, value in zip(keys, values)
+        ]
+
+    async def set_many(
+        self, mapping: dict[str, str | bytes], expire: int = 600
+    ) -> None:
+        await self.__remote.set_many(mapping, expire)
+        for key, value in mapping.items():
+            self.__local.set(key, value, min(expire, self.__local_ttl))
+
+    async def delete_many(self, keys: list[str]) -> None:
+        if not keys:
+            return
+        await self.__remote.delete_many(keys)
+        for key in keys:
+            self.__local.delete(key)
+        await self._publish(keys=keys)
+
+    def evict_local(
+        self, keys: list[str], namespaces: list[str] | None = None
+    ) -> None:
+        self._evict({"namespaces": namespaces or [], "keys": keys})
+
+    async def add_to_index(
+        self, index: str, key: str, score: float, expire: int = 600
+    ) -> None:
+        await self.__remote.add_to_index(index, key, score, expire)
+
+    async def pop_from_index(self, index: str, min_score: float) -> list[str]:
+        return await self.__remote.pop_from_index(index, min_score)
+
+    async def generate_cache_key(
+        self, service_name: str, method_name: str, *args: Any, **kwargs: Any
+    ) -> str:
+        return await self.__remote.generate_cache_key(
+            service_name, method_name, *args, **kwargs
+        )
+
+    def dumps(self, data: Any, fresh_for: float = 0, delta: float = 0) -> bytes:
+        return self.__remote.dumps(data, fresh_for, delta)
+
+    def metadata(self, data: bytes) -> CacheMetadata:
+        return self.__remote.metadata(data)
+
+    def loads(self, data: bytes, adapter: TypeAdapter[Any]) -> Any:
+        return self.__remote.loads(data, adapter)
+
+    async def invalidate_cache_with_prefix(
+        self, service_name: str, method_name: str
+    ):
+        namespace = f"{service_name}:{method_name}"
+        await self.__remote.invalidate_cache_with_prefix(
+            service_name, method_name
+        )
+        self.__local.delete_prefix(f"{namespace}:")
+        await self._publish(namespaces=[namespace])
+
+    async def acquire_lock(self, key: str, timeout: float) -> str | None:
+        return await self.__remote.acquire_lock(key, timeout)
+
+    async def release_lock(self, key: str, token: str) -> None:
+        await self.__remote.release_lock(key, token)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "local": self.__local.stats(),
+            "redis": self.__remote.stats(),
+        }
+
+
+tiered_cache: TieredCache | None = None
+
+
+async def get_tiered_cache() -> TieredCache | None:
+    return tiered_cache
@@ -1,6 +1,9 @@
 from logging import config as logging_config
 
+from src.configs.cache import CacheSettings
 from src.configs.logger import LOGGING
+from src.configs.outbox import OutboxSettings
+from src.configs.pagination import PaginationSettings
 from src.configs.postgres import PostgresSettings
 from src.configs.rabbitmq import RabbitSettings
 from src.configs.redis import RedisSettings
@@ -14,6 +17,9 @@ __all__ = [
     "RedisSettings",
     "RabbitSettings",
     "StartUpSettings",
+    "CacheSettings",
+    "PaginationSettings",
+    "OutboxSettings",
 ]
 
 logging_config.dictConfig(LOGGING)
@@ -29,6 +35,9 @@ class Settings(EnvSettings):
     postgres: PostgresSettings = PostgresSettings()
     redis: RedisSettings = RedisSettings()
     rabbit: RabbitSettings = RabbitSettings()
+    cache: CacheSettings = CacheSettings()
+    pagination: PaginationSettings = PaginationSettings()
+    outbox: OutboxSettings = OutboxSettings()
 
 
 settings = Settings()
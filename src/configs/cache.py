@@ -0,0 +1,79 @@
+from typing import Literal
+
+from pydantic import BaseModel, Field, field_validator
+
+from src.cache.codecs import check_serializer
+from src.utils.settings import EnvSettings
+
+
+class CacheTTL(BaseModel):
+    """
+    Lifetime of the cached values in seconds: after `soft` the value is
+    stale and refreshed in the background, after `hard` it expires.
+    """
+
+    soft: float = Field(ge=0)
+    hard: int = Field(ge=1)
+
+
+class CacheSettings(EnvSettings):
+    """
+    This class is used to store the service cache settings.
+    """
+
+    local_max_entries: int = Field(
+        default=10_000, alias="CACHE_LOCAL_MAX_ENTRIES", ge=0
+    )
+    local_max_bytes: int = Field(
+        default=64 * 1024 * 1024, alias="CACHE_LOCAL_MAX_BYTES", ge=0
+    )
+    local_ttl: int = Field(default=60, alias="CACHE_LOCAL_TTL", ge=1)
+    generation_ttl: float = Field(
+        default=1.0, alias="CACHE_GENERATION_TTL", ge=0
+    )
+    lock_timeout: float = Field(default=5.0, alias="CACHE_LOCK_TIMEOUT", gt=0)
+    lock_wait: float = Field(default=0.5, alias="CACHE_LOCK_WAIT", ge=0)
+    codec: Literal["pydantic", "orjson", "msgpack", "json"] = Field(
+        default="pydantic", alias="CACHE_CODEC"
+    )
+    compress_threshold: int = Field(
+        default=4096, alias="CACHE_COMPRESS_THRESHOLD", ge=0
+    )
+    invalidation_channel: str = Field(
+        default="cache:invalidate", alias="CACHE_INVALIDATION_CHANNEL"
+    )
+    soft_ttl: float = Field(default=300, alias="CACHE_SOFT_TTL", ge=0)
+    hard_ttl: int = Field(default=600, alias="CACHE_HARD_TTL", ge=1)
+    # Per service and per method overrides, as JSON keyed by "service" or
+    # "service:method", e.g. {"bookservice:get": {"soft": 60, "hard": 120}}
+    ttls: dict[str, CacheTTL] = Field(default_factory=dict, alias="CACHE_TTLS")
+    xfetch_beta: float = Field(default=1.0, alias="CACHE_XFETCH_BETA", ge=0)
+    # Lifetime of the tombstones cached for missing instances, 0 disables
+    negative_ttl: int = Field(default=30, alias="CACHE_NEGATIVE_TTL", ge=0)
+    # Warm-up of the first pages and of the most requested instances
+    warm_up: bool = Field(default=True, alias="CACHE_WARM_UP")
+    warm_up_pages: int = Field(default=3, alias="CACHE_WARM_UP_PAGES", ge=0)
+    warm_up_page_sizes: list[int] = Field(
+        default=[50], alias="CACHE_WARM_UP_PAGE_SIZES"
+    )
+    warm_up_top_k: int = Field(default=100, alias="CACHE_WARM_UP_TOP_K", ge=0)
+    warm_up_concurrency: int = Field(
+        default=4, alias="CACHE_WARM_UP_CONCURRENCY", ge=1
+    )
+    # Delay of the warm-up after a write, coalescing a burst of writes
+    warm_up_delay: float = Field(default=1.0, alias="CACHE_WARM_UP_DELAY", ge=0)
+
+    @field_validator("codec")
+    @classmethod
+    def _check_codec(cls, value: str) -> str:
+        # Fail on startup rather than on the first use of the cache
+        check_serializer(value)
+        return value
+
+    def get_ttl(self, service_name: str, method_name: str) -> CacheTTL:
+        return self.ttls.get(
+            f"{service_name}:{method_name}",
+            self.ttls.get(
+                service_name, CacheTTL(soft=self.soft_ttl, hard=self.hard_ttl)
+            ),
+        )
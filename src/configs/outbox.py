@@ -0,0 +1,15 @@
+from pydantic import Field
+
+from src.utils.settings import EnvSettings
+
+
+class OutboxSettings(EnvSettings):
+    """
+    This class is used to store the transactional outbox relay settings.
+    """
+
+    relay_enabled: bool = Field(default=True, alias="OUTBOX_RELAY_ENABLED")
+    batch_size: int = Field(default=100, alias="OUTBOX_BATCH_SIZE", ge=1)
+    poll_interval: float = Field(
+        default=1.0, alias="OUTBOX_POLL_INTERVAL", gt=0
+    )
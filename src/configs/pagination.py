@@ -0,0 +1,17 @@
+from pydantic import Field, SecretStr
+
+from src.utils.settings import EnvSettings
+
+
+class PaginationSettings(EnvSettings):
+    """
+    This class is used to store the list pagination settings.
+    """
+
+    cursor_secret: SecretStr = Field(..., alias="PAGINATION_CURSOR_SECRET")
+    approximate_count: bool = Field(
+        default=False, alias="PAGINATION_APPROXIMATE_COUNT"
+    )
+    approximate_count_threshold: int = Field(
+        default=100_000, alias="PAGINATION_APPROXIMATE_COUNT_THRESHOLD", ge=0
+    )
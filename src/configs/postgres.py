@@ -16,3 +16,20 @@ class PostgresSettings(SQLAlchemyConnection):
     port: int = Field(..., alias="POSTGRES_PORT")
     host_local: str = Field(default="localhost", alias="POSTGRES_HOST_LOCAL")
     port_local: int = Field(default=5432, alias="POSTGRES_PORT_LOCAL")
+    pool_size: int = Field(default=10, alias="POSTGRES_POOL_SIZE", ge=1)
+    max_overflow: int = Field(default=10, alias="POSTGRES_MAX_OVERFLOW", ge=0)
+    pool_timeout: float = Field(
+        default=30.0, alias="POSTGRES_POOL_TIMEOUT", gt=0
+    )
+    pool_pre_ping: bool = Field(default=True, alias="POSTGRES_POOL_PRE_PING")
+    pool_recycle: int = Field(default=1800, alias="POSTGRES_POOL_RECYCLE")
+
+    @property
+    def engine_options(self) -> dict[str, int | float | bool]:
+        return {
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "pool_pre_ping": self.pool_pre_ping,
+            "pool_recycle": self.pool_recycle,
+        }
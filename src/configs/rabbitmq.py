@@ -14,6 +14,21 @@ class RabbitSettings(ServiceSettings):
     port: int = Field(..., alias="RABBITMQ_PORT")
     host_local: str = Field(default="localhost", alias="RABBITMQ_HOST_LOCAL")
     port_local: int = Field(default=5672, alias="RABBITMQ_PORT_LOCAL")
+    reconnect_interval: float = Field(
+        default=5.0, alias="RABBITMQ_RECONNECT_INTERVAL", gt=0
+    )
+    publish_timeout: float = Field(
+        default=10.0, alias="RABBITMQ_PUBLISH_TIMEOUT", gt=0
+    )
+    events_exchange: str = Field(
+        default="book_events", alias="RABBITMQ_EVENTS_EXCHANGE"
+    )
+    consumer_prefetch: int = Field(
+        default=50, alias="RABBITMQ_CONSUMER_PREFETCH", ge=1
+    )
+    consumer_concurrency: int = Field(
+        default=4, alias="RABBITMQ_CONSUMER_CONCURRENCY", ge=1
+    )
 
     @computed_field
     def dsn(self) -> str:
@@ -14,6 +14,20 @@ class RedisSettings(ServiceSettings):
     port: int = Field(..., alias="REDIS_PORT")
     host_local: str = Field(default="localhost", alias="REDIS_HOST_LOCAL")
     port_local: int = Field(default=6379, alias="REDIS_PORT_LOCAL")
+    max_connections: int = Field(
+        default=50, alias="REDIS_MAX_CONNECTIONS", ge=1
+    )
+    pool_timeout: float = Field(default=5.0, alias="REDIS_POOL_TIMEOUT", gt=0)
+    socket_timeout: float = Field(
+        default=5.0, alias="REDIS_SOCKET_TIMEOUT", gt=0
+    )
+    socket_connect_timeout: float = Field(
+        default=2.0, alias="REDIS_SOCKET_CONNECT_TIMEOUT", gt=0
+    )
+    socket_keepalive: bool = Field(default=True, alias="REDIS_SOCKET_KEEPALIVE")
+    health_check_interval: int = Field(
+        default=30, alias="REDIS_HEALTH_CHECK_INTERVAL", ge=0
+    )
 
     @property
     def connection_dict(self) -> dict[str, Any]:
@@ -21,3 +35,15 @@ class RedisSettings(ServiceSettings):
             "host": self.correct_host(),
             "port": self.correct_port(),
         }
+
+    @property
+    def pool_options(self) -> dict[str, Any]:
+        return {
+            **self.connection_dict,
+            "max_connections": self.max_connections,
+            "timeout": self.pool_timeout,
+            "socket_timeout": self.socket_timeout,
+            "socket_connect_timeout": self.socket_connect_timeout,
+            "socket_keepalive": self.socket_keepalive,
+            "health_check_interval": self.health_check_interval,
+        }
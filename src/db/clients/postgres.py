@@ -1,8 +1,11 @@
 import logging
+import time
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from typing import Any
 
-from fastapi import Depends
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -14,23 +17,50 @@ from src.configs import PostgresSettings
 logger = logging.getLogger("PostgresDatabase")
 
 
-async def get_postgres_settings() -> PostgresSettings:
-    return PostgresSettings()
-
-
 class PostgresDatabase:
     def __init__(self, settings: PostgresSettings) -> None:
-        self._async_session_factory = async_sessionmaker(
-            create_async_engine(
-                settings.postgres_connection_url, echo=settings.sqlalchemy_echo
-            )
+        self._engine = create_async_engine(
+            settings.postgres_connection_url,
+            echo=settings.sqlalchemy_echo,
+            **settings.engine_options,
         )
+        self._async_session_factory = async_sessionmaker(self._engine)
+        self._connects = 0
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+        event.listen(self._engine.sync_engine, "connect", self._on_connect)
+        event.listen(self._engine.sync_engine, "checkout", self._on_checkout)
+
+    def _on_connect(self, *args: Any) -> None:
+        self._connects += 1
+
+    def _on_checkout(self, *args: Any) -> None:
+        self._checkouts += 1
+
+    async def _acquire_connection(self, session: AsyncSession) -> None:
+        """
+        Check out the session connection up front to measure the time spent
+        waiting for the pool.
+        """
+        started = time.perf_counter()
+        try:
+            await session.connection()
+        except PoolTimeoutError:
+            self._timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            self._wait_time_total += waited
+            self._wait_time_max = max(self._wait_time_max, waited)
 
     @asynccontextmanager
     async def get_session(self) -> AsyncIterator[AsyncSession]:
         try:
             logger.debug("==> Session open")
             session = self._async_session_factory()
+            await self._acquire_connection(session)
             yield session
         except Exception as error:
             logger.exception("==> Session rollback because of exception", error)
@@ -40,8 +70,33 @@ class PostgresDatabase:
             logger.debug("==> Session close")
             await session.close()
 
+    def pool_status(self) -> dict[str, int | float]:
+        """
+        Get the connection pool usage statistics of the current process.
+        """
+        pool = self._engine.pool
+        return {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "connects": self._connects,
+            "checkouts": self._checkouts,
+            "timeouts": self._timeouts,
+            "wait_time_total": round(self._wait_time_total, 6),
+            "wait_time_max": round(self._wait_time_max, 6),
+        }
+
+    async def close(self) -> None:
+        """
+        Dispose of the engine and close all pooled connections.
+        """
+        await self._engine.dispose()
+        logger.info("Connection pool to Postgres was disposed.")
+
+
+postgres_db: PostgresDatabase | None = None
+
 
-def get_postgres_db(
-    settings: PostgresSettings = Depends(get_postgres_settings, use_cache=True),
-) -> PostgresDatabase:
-    return PostgresDatabase(settings)
+async def get_postgres_db() -> PostgresDatabase | None:
+    return postgres_db
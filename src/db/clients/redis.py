@@ -0,0 +1,93 @@
+import logging
+import time
+from typing import Any
+
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.configs import RedisSettings
+
+logger = logging.getLogger("RedisConnectionPool")
+
+
+class InstrumentedConnectionPool(BlockingConnectionPool):
+    """
+    Blocking connection pool counting the connections it opens and the time
+    the callers wait for a free one.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.connects = 0
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def make_connection(self):
+        self.connects += 1
+        return super().make_connection()
+
+    async def get_connection(self, command_name, *keys, **options):
+        started = time.perf_counter()
+        try:
+            connection = await super().get_connection(
+                command_name, *keys, **options
+            )
+        except RedisConnectionError:
+            if time.perf_counter() - started >= self.timeout:
+                self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            self.wait_time_total += waited
+            self.wait_time_max = max(self.wait_time_max, waited)
+        self.checkouts += 1
+        return connection
+
+
+class RedisConnectionPool:
+    """
+    The connection pool shared by all the Redis clients of the process:
+    the cache, its pub/sub listener and the rate limiter.
+    """
+
+    def __init__(self, settings: RedisSettings) -> None:
+        self._pool = InstrumentedConnectionPool(**settings.pool_options)
+
+    def client(self) -> Redis:
+        """
+        Get a client using the shared pool. Closing the client does not
+        close the pool.
+        """
+        return Redis(connection_pool=self._pool)
+
+    def pool_status(self) -> dict[str, int | float]:
+        """
+        Get the connection pool usage statistics of the current process.
+        """
+        pool = self._pool
+        return {
+            "max_connections": pool.max_connections,
+            "in_use": len(pool._in_use_connections),
+            "available": len(pool._available_connections),
+            "connects": pool.connects,
+            "checkouts": pool.checkouts,
+            "timeouts": pool.timeouts,
+            "wait_time_total": round(pool.wait_time_total, 6),
+            "wait_time_max": round(pool.wait_time_max, 6),
+        }
+
+    async def close(self) -> None:
+        """
+        Close all pooled connections.
+        """
+        await self._pool.disconnect()
+        logger.info("Connection pool to Redis was closed.")
+
+
+redis_pool: RedisConnectionPool | None = None
+
+
+async def get_redis_pool() -> RedisConnectionPool | None:
+    return redis_pool
@@ -1,9 +1,11 @@
 from src.db.entities.base import Entity
 from src.db.entities.book import Book
+from src.db.entities.outbox import Outbox
 from src.db.entities.user import User
 
 __all__ = [
     "Entity",
     "Book",
+    "Outbox",
     "User",
 ]
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Annotated
 
-from sqlalchemy import DateTime, String
+from sqlalchemy import BigInteger, DateTime, Index, String, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.db.entities import Entity
@@ -13,7 +13,12 @@ published_date = Annotated[
 
 class Book(Entity):
     __tablename__ = "books"
+    __table_args__ = (Index("ix_books_created_at_uuid", "created_at", "uuid"),)
 
     title: Mapped[str] = mapped_column(String(64), unique=True)
     author: Mapped[str | None] = mapped_column(String(64))
     published_date: Mapped[published_date]
+    # Grows with every change of the book, carried by its change events
+    version: Mapped[int] = mapped_column(
+        BigInteger, server_default=text("1"), default=1
+    )
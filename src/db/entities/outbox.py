@@ -0,0 +1,19 @@
+from sqlalchemy import Index, LargeBinary, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.entities import Entity
+
+
+class Outbox(Entity):
+    """
+    Events written in the transaction of the change they describe, and
+    published to the broker afterwards by the outbox relay.
+    """
+
+    __tablename__ = "outbox"
+    __table_args__ = (Index("ix_outbox_created_at", "created_at"),)
+
+    exchange: Mapped[str | None] = mapped_column(String(255))
+    routing_key: Mapped[str] = mapped_column(String(255))
+    content_type: Mapped[str | None] = mapped_column(String(255))
+    payload: Mapped[bytes] = mapped_column(LargeBinary)
@@ -1,21 +1,30 @@
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from typing import Any, TypeVar
 from uuid import UUID
 
 from pydantic import BaseModel
 
+from src.api.schemas.db.outbox import OutboxMessage
+
 ModelType = TypeVar("ModelType", bound=BaseModel)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
+# Builds the event to put into the outbox from the changed (or removed) row
+EventFactory = Callable[[Any], OutboxMessage]
 
 
 class AbstractRepositoryCD(ABC):
     @abstractmethod
-    async def create(self, instance: CreateSchemaType) -> ModelType:
+    async def create(
+        self, instance: CreateSchemaType, event: EventFactory | None = None
+    ) -> ModelType:
         raise NotImplementedError
 
     @abstractmethod
-    async def remove(self, instance_uuid: UUID) -> UUID:
+    async def remove(
+        self, instance_uuid: UUID, event: EventFactory | None = None
+    ) -> UUID:
         raise NotImplementedError
 
 
@@ -28,18 +37,29 @@ class AbstractRepositoryCRD(AbstractRepositoryCD, ABC):
     async def get(self, instance_uuid: UUID, **kwargs) -> ModelType | Any:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_many(self, instance_uuids: list[UUID]) -> list[ModelType]:
+        raise NotImplementedError
+
 
 class AbstractRepository(AbstractRepositoryCRD, ABC):
     @abstractmethod
     async def update(
-        self, instance_uuid: UUID, instance: UpdateSchemaType
-    ) -> ModelType:
+        self,
+        instance_uuid: UUID,
+        instance: UpdateSchemaType,
+        event: EventFactory | None = None,
+    ) -> ModelType | None:
         raise NotImplementedError
 
     @abstractmethod
     async def count(self) -> int | None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def count_estimate(self) -> int | None:
+        raise NotImplementedError
+
     @abstractmethod
     async def get_uuid_filter_by(self, **kwargs) -> str | None:
         raise NotImplementedError
@@ -2,14 +2,19 @@ from typing import Any, Generic
 from uuid import UUID
 
 from fastapi.encoders import jsonable_encoder
-from sqlalchemy import delete, func, select
+from sqlalchemy import any_, delete, func, literal, select, text, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.clients.postgres import PostgresDatabase
+from src.db.entities import Outbox
 from src.db.repositories.abstract import (
     AbstractRepository,
     AbstractRepositoryCD,
     AbstractRepositoryCRD,
     CreateSchemaType,
+    EventFactory,
     ModelType,
     UpdateSchemaType,
 )
@@ -21,6 +26,26 @@ class InitRepository:
         self._database = database
         self._model = model
 
+    @staticmethod
+    def _add_event(
+        session: AsyncSession, event: EventFactory | None, obj: Any
+    ) -> None:
+        """
+        Put the event built from the changed row into the outbox, so it is
+        committed in the same transaction as the change.
+        """
+        if event is None:
+            return
+        message = event(obj)
+        session.add(
+            Outbox(
+                exchange=message.exchange,
+                routing_key=message.routing_key,
+                content_type=message.content_type,
+                payload=message.payload,
+            )
+        )
+
 
 class PostgresRepositoryCD(
     InitRepository,
@@ -28,20 +53,33 @@ class PostgresRepositoryCD(
     Generic[ModelType, CreateSchemaType],
 ):
     @retry(exceptions=(ConnectionError,))
-    async def create(self, instance: CreateSchemaType) -> ModelType:
+    async def create(
+        self, instance: CreateSchemaType, event: EventFactory | None = None
+    ) -> ModelType:
         async with self._database.get_session() as session:
             db_obj = self._model(**instance.dict())
             session.add(db_obj)
+            if event is not None:
+                await session.flush()
+                await session.refresh(db_obj)
+                self._add_event(session, event, db_obj)
             await session.commit()
             await session.refresh(db_obj)
             return db_obj
 
     @retry(exceptions=(ConnectionError,))
-    async def remove(self, instance_uuid: UUID, **kwargs) -> UUID:
+    async def remove(
+        self, instance_uuid: UUID, event: EventFactory | None = None, **kwargs
+    ) -> UUID:
         async with self._database.get_session() as session:
-            await session.execute(
-                delete(self._model).where(self._model.uuid == instance_uuid)
+            db_obj = await session.execute(
+                delete(self._model)
+                .where(self._model.uuid == instance_uuid)
+                .returning(self._model)
             )
+            removed = db_obj.scalars().first()
+            if removed is not None:
+                self._add_event(session, event, removed)
             await session.commit()
             return instance_uuid
 
@@ -53,16 +91,35 @@ class PostgresRepositoryCRD(
 ):
     @retry(exceptions=(ConnectionError,))
     async def get_all(self, **kwargs) -> list[ModelType]:
+        """
+        Get the rows in a stable (created_at, uuid) order.
+
+        Supports `limit`/`offset` pagination, and keyset pagination with
+        `after`/`before` holding the (created_at, uuid) of the row to seek
+        from.
+        """
         limit = kwargs.get("limit")
         offset = kwargs.get("offset")
+        after = kwargs.get("after")
+        before = kwargs.get("before")
+        sort_key = tuple_(self._model.created_at, self._model.uuid)
         async with self._database.get_session() as session:
             query = select(self._model)
+            if after:
+                query = query.where(sort_key > tuple_(*after))
+            if before:
+                query = query.where(sort_key < tuple_(*before)).order_by(
+                    self._model.created_at.desc(), self._model.uuid.desc()
+                )
+            else:
+                query = query.order_by(self._model.created_at, self._model.uuid)
             if limit:
                 query = query.limit(limit)
             if offset:
                 query = query.offset(offset)
             db_obj = await session.execute(query)
-            return db_obj.scalars().all()
+            objs = db_obj.scalars().all()
+            return objs[::-1] if before else objs
 
     @retry(exceptions=(ConnectionError,))
     async def get(self, instance_uuid: UUID, **kwargs) -> ModelType | Any:
@@ -72,6 +129,23 @@ class PostgresRepositoryCRD(
             )
             return db_obj.scalars().first()
 
+    @retry(exceptions=(ConnectionError,))
+    async def get_many(self, instance_uuids: list[UUID]) -> list[ModelType]:
+        """
+        Get the rows by UUID with one query, in no particular order.
+
+        The UUIDs are bound as a single array, `uuid = ANY($1)`, so the
+        statement is the same for any number of them.
+        """
+        if not instance_uuids:
+            return []
+        uuids = literal(list(instance_uuids), ARRAY(PG_UUID(as_uuid=True)))
+        async with self._database.get_session() as session:
+            db_obj = await session.execute(
+                select(self._model).where(self._model.uuid == any_(uuids))
+            )
+            return list(db_obj.scalars().all())
+
 
 class PostgresRepository(
     PostgresRepositoryCRD[ModelType, CreateSchemaType],
@@ -80,10 +154,19 @@ class PostgresRepository(
 ):
     @retry(exceptions=(ConnectionError,))
     async def update(
-        self, instance_uuid: UUID, instance: UpdateSchemaType
-    ) -> ModelType:
+        self,
+        instance_uuid: UUID,
+        instance: UpdateSchemaType,
+        event: EventFactory | None = None,
+    ) -> ModelType | None:
         async with self._database.get_session() as session:
-            db_obj = await self.get(instance_uuid)
+            # Read on this session, so the update holds a single connection
+            result = await session.execute(
+                select(self._model).where(self._model.uuid == instance_uuid)
+            )
+            db_obj = result.scalars().first()
+            if db_obj is None:
+                return None
 
             obj_data = jsonable_encoder(db_obj)
             update_data = instance.dict(exclude_unset=True)
@@ -91,7 +174,15 @@ class PostgresRepository(
             for field in obj_data:
                 if field in update_data:
                     setattr(db_obj, field, update_data[field])
+            if hasattr(self._model, "version"):
+                # Bumped by the UPDATE itself, so concurrent changes of the
+                # row get distinct versions
+                db_obj.version = self._model.version + 1
             session.add(db_obj)
+            if event is not None:
+                await session.flush()
+                await session.refresh(db_obj)
+                self._add_event(session, event, db_obj)
             await session.commit()
             await session.refresh(db_obj)
             return db_obj
@@ -103,6 +194,26 @@ class PostgresRepository(
             )
             return db_obj.scalars().first()
 
+    async def count_estimate(self) -> int | None:
+        """
+        Get the number of rows estimated by the planner statistics
+        (pg_class.reltuples), without scanning the table.
+
+        Returns None if the table has never been vacuumed or analyzed.
+        """
+        async with self._database.get_session() as session:
+            db_obj = await session.execute(
+                text(
+                    "SELECT reltuples::bigint FROM pg_class "
+                    "WHERE oid = to_regclass(:table_name)"
+                ),
+                {"table_name": self._model.__tablename__},
+            )
+            estimate = db_obj.scalars().first()
+            if estimate is None or estimate < 0:
+                return None
+            return estimate
+
     @retry(exceptions=(ConnectionError,))
     async def get_uuid_filter_by(self, **kwargs) -> str | None:
         if not kwargs:
@@ -0,0 +1,31 @@
+"""books version
+
+Revision ID: 4f8a1c3e7b20
+Revises: 9e4b7a2c5d18
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f8a1c3e7b20'
+down_revision: Union[str, None] = '9e4b7a2c5d18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'books',
+        sa.Column(
+            'version', sa.BigInteger(), server_default='1', nullable=False
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('books', 'version')
@@ -0,0 +1,27 @@
+"""books keyset pagination index
+
+Revision ID: 7c1d2e9f4a6b
+Revises: 3aa60a74f5bc
+Create Date: 2026-10-18 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1d2e9f4a6b'
+down_revision: Union[str, None] = '3aa60a74f5bc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_books_created_at_uuid', 'books', ['created_at', 'uuid'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_books_created_at_uuid', table_name='books')
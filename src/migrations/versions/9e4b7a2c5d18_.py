@@ -0,0 +1,39 @@
+"""outbox table
+
+Revision ID: 9e4b7a2c5d18
+Revises: 7c1d2e9f4a6b
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4b7a2c5d18'
+down_revision: Union[str, None] = '7c1d2e9f4a6b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('outbox',
+    sa.Column('routing_key', sa.String(length=255), nullable=False),
+    sa.Column('content_type', sa.String(length=255), nullable=True),
+    sa.Column('payload', sa.LargeBinary(), nullable=False),
+    sa.Column('uuid', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('NOW()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('NOW()'), nullable=False),
+    sa.PrimaryKeyConstraint('uuid'),
+    sa.UniqueConstraint('uuid')
+    )
+    op.create_index(
+        'ix_outbox_created_at', 'outbox', ['created_at'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_outbox_created_at', table_name='outbox')
+    op.drop_table('outbox')
@@ -0,0 +1,29 @@
+"""outbox exchange
+
+Revision ID: b2d6e0f9c431
+Revises: 4f8a1c3e7b20
+Create Date: 2026-10-18 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2d6e0f9c431'
+down_revision: Union[str, None] = '4f8a1c3e7b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'outbox',
+        sa.Column('exchange', sa.String(length=255), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('outbox', 'exchange')
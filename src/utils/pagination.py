@@ -1,9 +1,29 @@
+import base64
+import hashlib
+import hmac
+import json
+from datetime import datetime
 from http import HTTPStatus
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal, NamedTuple
+from uuid import UUID
 
 from fastapi import HTTPException, Query
 from pydantic import BaseModel, Field
 
+from src.configs import settings
+
+CURSOR_SIGNATURE_SIZE = 16
+
+
+class Keyset(NamedTuple):
+    """Position of a row in the (created_at, uuid) sort order."""
+
+    created_at: datetime
+    uuid: UUID
+
+    def __str__(self) -> str:
+        return f"{self.created_at.isoformat()},{self.uuid}"
+
 
 class PaginatedMixin(BaseModel):
     count: int = Field(
@@ -14,6 +34,12 @@ class PaginatedMixin(BaseModel):
         description="Количество страниц с заданным 'page_size'",
         examples=[20],
     )
+    count_is_exact: bool = Field(
+        default=True,
+        description="Флаг - являются ли 'count' и 'total_pages' точными, "
+        "а не оценкой по статистике таблицы",
+        examples=[True],
+    )
     prev: int | None = Field(
         description="Номер предыдущей страницы",
         examples=[1],
@@ -31,16 +57,51 @@ class PaginatedData(PaginatedMixin):
     results: Any
 
 
+class CursorPaginatedMixin(BaseModel):
+    prev_cursor: str | None = Field(
+        description="Курсор предыдущей страницы",
+        examples=[
+            "eyJkIjoicCIsImsiOlsiMjAyNC0wNC0xOVQxNzoxNzozMSJdfQ.c2lnbmF0dXJl"
+        ],
+    )
+    next_cursor: str | None = Field(
+        description="Курсор следующей страницы",
+        examples=[
+            "eyJkIjoibiIsImsiOlsiMjAyNC0wNC0xOVQxNzoxNzozMSJdfQ.c2lnbmF0dXJl"
+        ],
+    )
+
+    class Meta:
+        abstract = True
+
+
+class CursorPaginatedData(CursorPaginatedMixin):
+    results: Any
+
+
 class Paginator:
     __count: int
+    __count_is_exact: bool
 
-    def __init__(self, page_number: int, page_size: int):
+    def __init__(
+        self, page_number: int, page_size: int, approximate_count: bool = False
+    ):
         self.__page_number = page_number
         self.__page_size = page_size
+        self.__approximate_count = approximate_count
+
+    @property
+    def params(self) -> dict[str, Any]:
+        return {
+            "page_number": self.__page_number,
+            "page_size": self.__page_size,
+        }
 
     async def __call__(self, service, method, **kwargs) -> PaginatedData:
         try:
-            self.__count = await service.count(**kwargs)
+            self.__count, self.__count_is_exact = await self._count(
+                service, **kwargs
+            )
         except Exception as e:
             raise HTTPException(
                 status_code=HTTPStatus.NOT_FOUND,
@@ -55,8 +116,16 @@ class Paginator:
             )
         return PaginatedData(**self._get_result_params().dict(), results=models)
 
+    async def _count(self, service, **kwargs) -> tuple[int, bool]:
+        if self.__approximate_count:
+            estimate = await service.count_estimate()
+            if estimate is not None:
+                return estimate, False
+        return await service.count(**kwargs), True
+
     def _validate(self) -> dict[str, Any]:
-        if self.__page_number > 1:
+        # An estimated count may be off, let the page query decide instead
+        if self.__page_number > 1 and self.__count_is_exact:
             total = (self.__page_number - 1) * self.__page_size + 1
             if total > self.__count:
                 raise HTTPException(
@@ -81,11 +150,102 @@ class Paginator:
         return PaginatedMixin(
             count=self.__count,
             total_pages=total_pages,
+            count_is_exact=self.__count_is_exact,
             prev=prev,
             next=next,
         )
 
 
+class CursorPaginator:
+    """
+    Keyset pagination over the (created_at, uuid) sort order.
+
+    Every page costs one index seek whatever its position in the list, and
+    no total count is computed. Cursors are opaque, HMAC-signed tokens.
+    """
+
+    def __init__(self, cursor: str | None, page_size: int, secret: bytes):
+        self.__secret = secret
+        self.__cursor = cursor
+        self.__page_size = page_size
+
+    @property
+    def params(self) -> dict[str, Any]:
+        return {"cursor": self.__cursor, "page_size": self.__page_size}
+
+    async def __call__(self, service, method, **kwargs) -> CursorPaginatedData:
+        # Decoded only here, so the cursor is not checked in the page mode
+        direction, keyset = (
+            self._decode(self.__cursor) if self.__cursor else ("n", None)
+        )
+        # One extra row tells whether there is a page beyond this one
+        kwargs["limit"] = self.__page_size + 1
+        if keyset is not None:
+            kwargs["after" if direction == "n" else "before"] = keyset
+        attr = getattr(service, method)
+        models = await attr(**kwargs)
+        if not models:
+            raise HTTPException(
+                status_code=HTTPStatus.NOT_FOUND, detail="data not found"
+            )
+        has_more = len(models) > self.__page_size
+        prev_cursor = None
+        next_cursor = None
+        if direction == "n":
+            models = models[: self.__page_size]
+            if keyset is not None:
+                prev_cursor = self._encode("p", models[0])
+            if has_more:
+                next_cursor = self._encode("n", models[-1])
+        else:
+            models = models[-self.__page_size :]
+            if has_more:
+                prev_cursor = self._encode("p", models[0])
+            next_cursor = self._encode("n", models[-1])
+        return CursorPaginatedData(
+            prev_cursor=prev_cursor, next_cursor=next_cursor, results=models
+        )
+
+    def _sign(self, payload: bytes) -> bytes:
+        return hmac.digest(self.__secret, payload, hashlib.sha256)[
+            :CURSOR_SIGNATURE_SIZE
+        ]
+
+    def _encode(self, direction: Literal["n", "p"], model: Any) -> str:
+        payload = json.dumps(
+            {
+                "d": direction,
+                "k": [model.created_at.isoformat(), str(model.uuid)],
+            },
+            separators=(",", ":"),
+        ).encode()
+        return ".".join(
+            base64.urlsafe_b64encode(part).rstrip(b"=").decode()
+            for part in (payload, self._sign(payload))
+        )
+
+    def _decode(self, cursor: str) -> tuple[str, Keyset]:
+        try:
+            payload, signature = (
+                base64.urlsafe_b64decode(part + "=" * (-len(part) % 4))
+                for part in cursor.split(".")
+            )
+            if not hmac.compare_digest(signature, self._sign(payload)):
+                raise ValueError("Bad signature")
+            data = json.loads(payload)
+            created_at, uuid = data["k"]
+            if data["d"] not in ("n", "p"):
+                raise ValueError("Bad direction")
+            return data["d"], Keyset(
+                datetime.fromisoformat(created_at), UUID(uuid)
+            )
+        except (ValueError, KeyError, TypeError):
+            raise HTTPException(
+                status_code=HTTPStatus.BAD_REQUEST,
+                detail="Incorrect pagination cursor is set",
+            ) from None
+
+
 def get_paginator(
     page_number: Annotated[
         int,
@@ -94,7 +254,6 @@ def get_paginator(
             title="Page number",
             description="The number of the page to get",
             ge=1,
-            le=100,
         ),
     ] = 1,
     page_size: Annotated[
@@ -108,4 +267,34 @@ def get_paginator(
         ),
     ] = 50,
 ) -> Paginator:
-    return Paginator(page_number, page_size)
+    return Paginator(
+        page_number, page_size, settings.pagination.approximate_count
+    )
+
+
+def get_cursor_paginator(
+    cursor: Annotated[
+        str | None,
+        Query(
+            alias="cursor",
+            title="Cursor",
+            description="The cursor of the page to get, "
+            "as returned in 'next_cursor' or 'prev_cursor'",
+        ),
+    ] = None,
+    page_size: Annotated[
+        int,
+        Query(
+            alias="page_size",
+            title="Page size",
+            description="The size of the page to get",
+            ge=1,
+            le=100,
+        ),
+    ] = 50,
+) -> CursorPaginator:
+    return CursorPaginator(
+        cursor,
+        page_size,
+        settings.pagination.cursor_secret.get_secret_value().encode(),
+    )
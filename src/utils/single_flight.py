@@ -0,0 +1,31 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key into a single execution.
+
+    The first caller starts the call, the callers that arrive while it is in
+    flight await the same result instead of running it again.
+    """
+
+    def __init__(self) -> None:
+        self.__calls: dict[str, asyncio.Task[Any]] = {}
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        task = self.__calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self.__calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        # Cancelling one of the callers must not cancel the shared call
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task[Any]) -> None:
+        if self.__calls.get(key) is task:
+            del self.__calls[key]
+
+    def __len__(self) -> int:
+        return len(self.__calls)
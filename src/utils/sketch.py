@@ -0,0 +1,83 @@
+import hashlib
+import struct
+
+
+class FrequencySketch:
+    """
+    Approximate request frequencies of the keys in a fixed amount of memory.
+
+    The counts are kept in a count-min sketch: `depth` rows of `width`
+    counters, a key increments one counter per row and its frequency is
+    estimated as the smallest of them. The `top_k` most frequent keys are
+    tracked along with their estimates.
+
+    After `width * 10` additions all the counters are halved, so the keys
+    which stopped being requested age out of the top.
+    """
+
+    def __init__(self, width: int = 4096, depth: int = 4, top_k: int = 100):
+        self.__width = width
+        self.__depth = depth
+        self.__top_k = top_k
+        self.__rows = [[0] * width for _ in range(depth)]
+        self.__top: dict[str, int] = {}
+        self.__additions = 0
+        self.__sample_size = width * 10
+        self.__unpack = struct.Struct(f"<{depth}I").unpack
+
+    def _indexes(self, key: str) -> list[int]:
+        # A slice of one digest per row, so the keys colliding in one row do
+        # not collide in the others, as they do with hash((row, key))
+        digest = hashlib.blake2b(key.encode(), digest_size=4 * self.__depth)
+        return [
+            value % self.__width for value in self.__unpack(digest.digest())
+        ]
+
+    def add(self, key: str) -> int:
+        """
+        Count a request of the key.
+
+        Returns:
+            int: The estimated frequency of the key.
+        """
+        estimate = None
+        for row, index in zip(self.__rows, self._indexes(key)):
+            row[index] += 1
+            if estimate is None or row[index] < estimate:
+                estimate = row[index]
+        self._update_top(key, estimate or 0)
+        self.__additions += 1
+        if self.__additions >= self.__sample_size:
+            self._age()
+        return estimate or 0
+
+    def estimate(self, key: str) -> int:
+        return min(
+            row[index] for row, index in zip(self.__rows, self._indexes(key))
+        )
+
+    def top(self) -> list[str]:
+        """
+        Get the most frequent keys, the most frequent first.
+        """
+        return sorted(self.__top, key=self.__top.__getitem__, reverse=True)
+
+    def _update_top(self, key: str, estimate: int) -> None:
+        if key in self.__top or len(self.__top) < self.__top_k:
+            self.__top[key] = estimate
+            return
+        if not self.__top_k:
+            return
+        least = min(self.__top, key=self.__top.__getitem__)
+        if estimate > self.__top[least]:
+            del self.__top[least]
+            self.__top[key] = estimate
+
+    def _age(self) -> None:
+        for row in self.__rows:
+            for index, count in enumerate(row):
+                row[index] = count >> 1
+        self.__top = {
+            key: count >> 1 for key, count in self.__top.items() if count > 1
+        }
+        self.__additions = 0
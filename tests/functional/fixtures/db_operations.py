@@ -1,25 +1,32 @@
+import json
 from http import HTTPStatus
 from typing import Any
 
-import pytest
 import pytest_asyncio
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from tests.functional.settings import settings
 from tests.models import Book, User
 
 
 @pytest_asyncio.fixture(scope="function", autouse=True)
 async def clear_cache(redis_client: Redis):
     await redis_client.flushdb(asynchronous=True)
+    # Сбрасываем и локальный кеш API, он не видит очистку Redis
+    await redis_client.publish(
+        settings.cache_invalidation_channel, json.dumps({"flush": True})
+    )
 
 
-@pytest.fixture
-def generate_cache_key():
-    def inner(
+@pytest_asyncio.fixture
+async def generate_cache_key(redis_client: Redis):
+    async def inner(
         service_name: str, method_name: str, *args: Any, **kwargs: Any
     ) -> str:
-        key = f"{service_name}:{method_name}:"
+        namespace = f"{service_name}:{method_name}"
+        generation = await redis_client.get(f"generation:{namespace}")
+        key = f"{namespace}:{int(generation or 0)}:"
         if args:
             key += ":".join(str(arg) for arg in args)
         if kwargs:
@@ -34,7 +41,9 @@ async def check_cache(redis_client: Redis, generate_cache_key):
     async def inner(
         service_name: str, method_name: str, *args: Any, **kwargs: Any
     ) -> Any:
-        key = generate_cache_key(service_name, method_name, *args, **kwargs)
+        key = await generate_cache_key(
+            service_name, method_name, *args, **kwargs
+        )
         data = await redis_client.get(key)
         return data
 
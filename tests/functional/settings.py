@@ -42,6 +42,10 @@ class TestSettings(ServiceSettings):
     api_host: str = Field(..., alias="API_HOST")
     api_port: int = Field(..., alias="API_PORT")
 
+    cache_invalidation_channel: str = Field(
+        default="cache:invalidate", alias="CACHE_INVALIDATION_CHANNEL"
+    )
+
     grpc_server_host: str = Field(
         default="grpcserver.com", alias="GRPC_SERVER_HOST"
     )
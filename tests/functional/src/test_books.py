@@ -1,6 +1,7 @@
 import pytest
 from http import HTTPStatus
 from datetime import datetime
+from uuid import uuid4
 
 
 @pytest.mark.parametrize("query_data, expected", [
@@ -64,6 +65,123 @@ async def test_get_all_books(make_get_request, create_user, create_book, check_c
         assert len(body["books"]) == expected["length"]
 
 
+@pytest.mark.asyncio
+async def test_get_all_books_cursor(make_get_request, create_user, create_book, get_access_token):
+    path = "/books/"
+
+    await create_user(email="user@test.com", password="password", username="testuser")
+    access_token = await get_access_token("testuser", "password")
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    published_date = datetime.strptime("2020-01-01", "%Y-%m-%d")
+    for number in range(3):
+        await create_book(title=f"Book {number}", author="Author", published_date=published_date)
+
+    query_data = {"pagination": "cursor", "page_size": 2}
+    body, status, _ = await make_get_request(path, query_data=query_data, headers=headers)
+
+    assert status == HTTPStatus.OK
+    assert [book["title"] for book in body["books"]] == ["Book 0", "Book 1"]
+    assert body["prev_cursor"] is None
+    assert body["next_cursor"] is not None
+
+    # Переход на следующую страницу по курсору
+    query_data["cursor"] = body["next_cursor"]
+    body, status, _ = await make_get_request(path, query_data=query_data, headers=headers)
+
+    assert status == HTTPStatus.OK
+    assert [book["title"] for book in body["books"]] == ["Book 2"]
+    assert body["prev_cursor"] is not None
+    assert body["next_cursor"] is None
+
+    # Возврат на предыдущую страницу по курсору
+    query_data["cursor"] = body["prev_cursor"]
+    body, status, _ = await make_get_request(path, query_data=query_data, headers=headers)
+
+    assert status == HTTPStatus.OK
+    assert [book["title"] for book in body["books"]] == ["Book 0", "Book 1"]
+
+    # Подделанный курсор не принимается
+    query_data["cursor"] = query_data["cursor"][:-2] + "xx"
+    body, status, _ = await make_get_request(path, query_data=query_data, headers=headers)
+
+    assert status == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_get_all_books_cursor_backwards(make_get_request, create_user, create_book, get_access_token):
+    path = "/books/"
+
+    await create_user(email="user@test.com", password="password", username="testuser")
+    access_token = await get_access_token("testuser", "password")
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    published_date = datetime.strptime("2020-01-01", "%Y-%m-%d")
+    for number in range(5):
+        await create_book(title=f"Book {number}", author="Author", published_date=published_date)
+
+    # Доходим по курсорам до последней страницы
+    query_data = {"pagination": "cursor", "page_size": 2}
+    pages = []
+    while True:
+        body, status, _ = await make_get_request(path, query_data=query_data, headers=headers)
+        assert status == HTTPStatus.OK
+        pages.append([book["title"] for book in body["books"]])
+        if body["next_cursor"] is None:
+            break
+        query_data["cursor"] = body["next_cursor"]
+
+    assert pages == [["Book 0", "Book 1"], ["Book 2", "Book 3"], ["Book 4"]]
+
+    # Возвращаемся по prev_cursor до первой страницы
+    for expected in reversed(pages[:-1]):
+        assert body["prev_cursor"] is not None
+        query_data["cursor"] = body["prev_cursor"]
+        body, status, _ = await make_get_request(path, query_data=query_data, headers=headers)
+
+        assert status == HTTPStatus.OK
+        assert [book["title"] for book in body["books"]] == expected
+        assert body["next_cursor"] is not None
+
+    assert body["prev_cursor"] is None
+
+
+@pytest.mark.parametrize("query_data, expected", [
+    ({"pagination": "cursor", "cursor": "not-a-cursor"}, HTTPStatus.BAD_REQUEST),
+    ({"pagination": "cursor", "cursor": "tampered"}, HTTPStatus.BAD_REQUEST),
+    ({"pagination": "page", "cursor": "not-a-cursor"}, HTTPStatus.OK),
+])
+@pytest.mark.asyncio
+async def test_get_all_books_bad_cursor(
+    make_get_request, create_user, create_book, get_access_token, query_data, expected
+    ):
+    path = "/books/"
+
+    await create_user(email="user@test.com", password="password", username="testuser")
+    access_token = await get_access_token("testuser", "password")
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    published_date = datetime.strptime("2020-01-01", "%Y-%m-%d")
+    for number in range(3):
+        await create_book(title=f"Book {number}", author="Author", published_date=published_date)
+
+    query_data = {"page_size": 2, **query_data}
+    if query_data["cursor"] == "tampered":
+        # Курсор с верной структурой, но чужой подписью
+        body, status, _ = await make_get_request(
+            path, query_data={"pagination": "cursor", "page_size": 2}, headers=headers
+        )
+        assert status == HTTPStatus.OK
+        query_data["cursor"] = body["next_cursor"][:-2] + "xx"
+
+    body, status, _ = await make_get_request(path, query_data=query_data, headers=headers)
+
+    assert status == expected
+    if status == HTTPStatus.OK:
+        # Курсор не учитывается при постраничной пагинации
+        assert [book["title"] for book in body["books"]] == ["Book 0", "Book 1"]
+
+
 @pytest.mark.parametrize("book_uuid, expected", [
     ("empty", {"status": HTTPStatus.OK}),
     ("a3943358-5cd5-4ee5-b8ff-4d1b34b6764b", {"status": HTTPStatus.NOT_FOUND}),
@@ -109,6 +227,61 @@ async def test_get_book_by_uuid(
         assert status == HTTPStatus.OK
         assert body["uuid"] == str(book.uuid)
 
+
+@pytest.mark.asyncio
+async def test_batch_get_books(make_post_request, create_user, create_book, get_access_token):
+    path = "/books/batch-get"
+
+    await create_user(email="user@test.com", password="password", username="testuser")
+    access_token = await get_access_token("testuser", "password")
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    published_date = datetime.strptime("2020-01-01", "%Y-%m-%d")
+    books = [
+        await create_book(title=f"Book {number}", author="Author", published_date=published_date)
+        for number in range(3)
+    ]
+    missing_uuid = "a3943358-5cd5-4ee5-b8ff-4d1b34b6764b"
+
+    # Книги возвращаются в порядке запроса, отсутствующие пропускаются
+    uuids = [str(books[2].uuid), missing_uuid, str(books[0].uuid), str(books[1].uuid)]
+    body, status, _ = await make_post_request(path, body={"uuids": uuids}, headers=headers)
+
+    assert status == HTTPStatus.OK
+    assert [book["uuid"] for book in body["books"]] == [uuids[0], uuids[2], uuids[3]]
+    assert [book["title"] for book in body["books"]] == ["Book 2", "Book 0", "Book 1"]
+
+    # Повторный запрос отдаётся из кеша, включая отсутствующую книгу
+    body, status, _ = await make_post_request(path, body={"uuids": uuids}, headers=headers)
+
+    assert status == HTTPStatus.OK
+    assert [book["uuid"] for book in body["books"]] == [uuids[0], uuids[2], uuids[3]]
+
+
+@pytest.mark.parametrize("uuids_count, expected", [
+    (0, HTTPStatus.UNPROCESSABLE_ENTITY),
+    (100, HTTPStatus.OK),
+    (101, HTTPStatus.UNPROCESSABLE_ENTITY),
+])
+@pytest.mark.asyncio
+async def test_batch_get_books_limits(make_post_request, create_user, get_access_token, uuids_count, expected):
+    path = "/books/batch-get"
+
+    body, status, _ = await make_post_request(path, body={"uuids": [str(uuid4())]})
+    assert status == HTTPStatus.UNAUTHORIZED
+
+    await create_user(email="user@test.com", password="password", username="testuser")
+    access_token = await get_access_token("testuser", "password")
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    uuids = [str(uuid4()) for _ in range(uuids_count)]
+    body, status, _ = await make_post_request(path, body={"uuids": uuids}, headers=headers)
+
+    assert status == expected
+    if status == HTTPStatus.OK:
+        assert body["books"] == []
+
+
 @pytest.mark.parametrize("book_data, expected", [
     ({"title": "New Book", "author": "Author", "published_date": "2022-01-01"}, {"status": HTTPStatus.OK, "user": "admin"}),
     ({"title": "New Book", "author": "Author", "published_date": "2022-01-01"}, {"status": HTTPStatus.UNAUTHORIZED, "user": "nobody"}),
@@ -176,7 +349,7 @@ async def test_create_book_as_admin(make_post_request, create_user, get_access_t
     ),
 ])
 @pytest.mark.asyncio
-async def test_update_book_as_admin(make_patch_request, create_user, get_access_token, create_book, query_data, expected):
+async def test_update_book_as_admin(make_patch_request, create_user, get_access_token, create_book, check_cache, query_data, expected):
     published_date = datetime.strptime("2020-01-01", "%Y-%m-%d")
     book = await create_book(title="Book 1", author="Author 1", published_date=published_date)
     book_uuid = query_data["book_uuid"]
@@ -214,6 +387,11 @@ async def test_update_book_as_admin(make_patch_request, create_user, get_access_
         assert body["title"] == book_title
         assert body["author"] == query_data["book_data"]["author"]
 
+        # Проверка, что обновленная книга записана в кеш
+        cached_book = await check_cache("bookservice", "get", book_uuid)
+        assert cached_book is not None
+        assert query_data["book_data"]["author"].encode() in cached_book
+
 
 @pytest.mark.parametrize("book_uuid, expected", [
     ("empty", {"status": HTTPStatus.OK, "user": "admin"}),
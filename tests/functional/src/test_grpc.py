@@ -1,6 +1,7 @@
 from datetime import datetime
 
 import pytest
+from google.protobuf.field_mask_pb2 import FieldMask
 from grpc.aio import insecure_channel
 
 from tests.functional.settings import settings
@@ -23,6 +24,30 @@ async def test_grpc_get_book(create_book):
         assert response.title == "Test Book"
 
 
+@pytest.mark.asyncio
+async def test_grpc_get_book_read_mask(create_book):
+    published_date = datetime.strptime("2020-01-01", "%Y-%m-%d")
+    book = await create_book(
+        title="Test Book", author="Test Author", published_date=published_date
+    )
+
+    async with insecure_channel(settings.get_grpc_server_host) as channel:
+        client = books_pb2_grpc.BookServiceStub(channel)
+        response = await client.GetBookById(
+            books_pb2.BookIdRequest(
+                uuid=str(book.uuid),
+                read_mask=FieldMask(paths=["title", "published_at"]),
+            )
+        )
+        assert response.title == "Test Book"
+        assert response.published_at.ToDatetime().date() == (
+            published_date.date()
+        )
+        assert not response.author
+        assert not response.published_date
+        assert not response.HasField("created_at")
+
+
 @pytest.mark.asyncio
 async def test_grpc_get_all_books(create_book):
     published_date_1 = datetime.strptime("2021-01-01", "%Y-%m-%d")
@@ -38,3 +63,82 @@ async def test_grpc_get_all_books(create_book):
         client = books_pb2_grpc.BookServiceStub(channel)
         response = await client.GetAllBooks(books_pb2.Empty())
         assert len(response.books) == 2
+
+
+@pytest.mark.asyncio
+async def test_grpc_list_books(create_book):
+    published_date = datetime.strptime("2021-01-01", "%Y-%m-%d")
+    for number in range(3):
+        await create_book(
+            title=f"Test Book {number}",
+            author="Author",
+            published_date=published_date,
+        )
+
+    async with insecure_channel(settings.get_grpc_server_host) as channel:
+        client = books_pb2_grpc.BookServiceStub(channel)
+        books = [
+            book
+            async for book in client.ListBooks(books_pb2.ListBooksRequest())
+        ]
+        assert [book.title for book in books] == [
+            "Test Book 0",
+            "Test Book 1",
+            "Test Book 2",
+        ]
+
+
+@pytest.mark.asyncio
+async def test_grpc_list_books_page(create_book):
+    published_date = datetime.strptime("2021-01-01", "%Y-%m-%d")
+    for number in range(3):
+        await create_book(
+            title=f"Test Book {number}",
+            author="Author",
+            published_date=published_date,
+        )
+
+    async with insecure_channel(settings.get_grpc_server_host) as channel:
+        client = books_pb2_grpc.BookServiceStub(channel)
+        first_page = await client.ListBooksPage(
+            books_pb2.ListBooksRequest(page_size=2)
+        )
+        assert len(first_page.books) == 2
+        assert first_page.next_page_token
+
+        last_page = await client.ListBooksPage(
+            books_pb2.ListBooksRequest(
+                page_size=2, page_token=first_page.next_page_token
+            )
+        )
+        assert [book.title for book in last_page.books] == ["Test Book 2"]
+        assert not last_page.next_page_token
+
+
+@pytest.mark.asyncio
+async def test_grpc_batch_get_books(create_book):
+    published_date = datetime.strptime("2021-01-01", "%Y-%m-%d")
+    books = [
+        await create_book(
+            title=f"Test Book {number}",
+            author="Author",
+            published_date=published_date,
+        )
+        for number in range(2)
+    ]
+
+    async with insecure_channel(settings.get_grpc_server_host) as channel:
+        client = books_pb2_grpc.BookServiceStub(channel)
+        response = await client.BatchGetBooks(
+            books_pb2.BatchGetBooksRequest(
+                uuids=[
+                    str(books[1].uuid),
+                    "00000000-0000-0000-0000-000000000000",
+                    str(books[0].uuid),
+                ]
+            )
+        )
+        assert [book.title for book in response.books] == [
+            "Test Book 1",
+            "Test Book 0",
+        ]
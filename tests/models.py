@@ -3,7 +3,16 @@ from datetime import datetime
 from typing import Annotated
 
 from pydantic import SecretStr
-from sqlalchemy import Boolean, DateTime, String, false, text
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    DateTime,
+    Index,
+    LargeBinary,
+    String,
+    false,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, declarative_base, mapped_column
 from werkzeug.security import generate_password_hash
@@ -54,6 +63,19 @@ class Book(Entity):
     title: Mapped[str] = mapped_column(String(64), unique=True)
     author: Mapped[str | None] = mapped_column(String(64))
     published_date: Mapped[published_date]
+    version: Mapped[int] = mapped_column(
+        BigInteger, server_default=text("1"), default=1
+    )
+
+
+class Outbox(Entity):
+    __tablename__ = "outbox"
+    __table_args__ = (Index("ix_outbox_created_at", "created_at"),)
+
+    exchange: Mapped[str | None] = mapped_column(String(255))
+    routing_key: Mapped[str] = mapped_column(String(255))
+    content_type: Mapped[str | None] = mapped_column(String(255))
+    payload: Mapped[bytes] = mapped_column(LargeBinary)
 
 
 class User(Entity):
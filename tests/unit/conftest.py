@@ -0,0 +1,7 @@
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+# Настройки приложения читаются из окружения, модули с ними импортируются
+# с тестовыми значениями, если окружение не задано
+load_dotenv(Path(__file__).parents[2] / "env-example.test")
@@ -0,0 +1,124 @@
+import math
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.api.brokers.events import decode_book_event, encode_book_event
+from src.api.brokers.events_pb2 import BookEvent
+from src.api.endpoints.v1.books import get_book
+from src.api.schemas.db.book import BookDB
+from src.api.services.base import CachedValue
+from src.api.services.book import BookService
+from src.cache.codecs import CacheMetadata
+from src.utils.pagination import Keyset
+
+
+def make_service():
+    return BookService(MagicMock(), BookDB, MagicMock())
+
+
+@pytest.mark.asyncio
+async def test_cached_responses_are_counted():
+    service = make_service()
+    service.get_response_cache_key = AsyncMock(return_value="key")
+    service.get_cached_response = AsyncMock(return_value=b"{}")
+    service.get = AsyncMock()
+    book_uuid = uuid4()
+
+    for _ in range(3):
+        await get_book(book_uuid, books_service=service)
+
+    # Ответы из кеша учитываются при выборе книг для прогрева
+    service.get.assert_not_called()
+    assert service._popularity.estimate(str(book_uuid)) == 3
+    assert service._popularity.top() == [str(book_uuid)]
+
+
+@pytest.mark.asyncio
+async def test_cached_responses_expire_at_soft_ttl():
+    service = make_service()
+    service._cache.set = AsyncMock()
+    service._cache.get = AsyncMock(side_effect=[None, b"{}"])
+    ttl = service._get_ttl("get_response")
+
+    assert await service.get_cached_response("key", "get") is None
+    await service.set_cached_response("key", b"{}", "get")
+    assert await service.get_cached_response("key", "get") == b"{}"
+
+    # Тело ответа не отдаётся дольше, чем живут свежими закешированные книги
+    service._cache.set.assert_awaited_once_with(
+        "key", b"{}", math.ceil(ttl.soft)
+    )
+    assert service.stats()["get_response"] == {"hits": 1, "misses": 1}
+
+
+def make_book():
+    now = datetime(2024, 1, 1, tzinfo=UTC)
+    return BookDB(
+        uuid=uuid4(),
+        title="Book",
+        author="Author",
+        published_date=now,
+        created_at=now,
+        updated_at=now,
+        version=1,
+    )
+
+
+@pytest.mark.parametrize("removed", [False, True])
+@pytest.mark.asyncio
+async def test_created_event_replaces_tombstone(removed):
+    service = make_service()
+    service._cache.generate_cache_key = AsyncMock(return_value="key")
+    service._read = AsyncMock(
+        return_value=CachedValue(None, CacheMetadata(0, 0))
+    )
+    service._write_through = AsyncMock()
+    service._invalidate_pages = AsyncMock()
+    book = make_book()
+    service._repository.get = AsyncMock(return_value=None if removed else book)
+
+    event = decode_book_event(encode_book_event(BookEvent.CREATED, book))
+    await service.apply_event(event)
+
+    if removed:
+        # Книга удалена после создания, tombstone остаётся
+        service._write_through.assert_not_awaited()
+    else:
+        service._write_through.assert_awaited_once_with(book)
+        service._invalidate_pages.assert_awaited_once_with(
+            since=book.created_at
+        )
+
+
+CURSOR = Keyset(datetime(2024, 1, 1, 0, 5, tzinfo=UTC), uuid4())
+
+
+@pytest.mark.parametrize(
+    "params, length, minutes",
+    [
+        # Полная страница затрагивается книгами, созданными до её последней
+        ({"limit": 2}, 2, 1),
+        # Последнюю страницу затрагивает любая новая книга
+        ({"limit": 2}, 1, None),
+        # Страницу перед курсором затрагивают книги, созданные до курсора
+        ({"limit": 2, "before": CURSOR}, 2, 5),
+        ({"limit": 2, "before": CURSOR}, 0, 5),
+    ],
+)
+def test_page_score(params, length, minutes):
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    page = [
+        SimpleNamespace(created_at=start + timedelta(minutes=number))
+        for number in range(length)
+    ]
+
+    score = BookService._get_page_score(params, page)
+
+    if minutes is None:
+        assert score == math.inf
+    else:
+        assert score == (start + timedelta(minutes=minutes)).timestamp()
@@ -0,0 +1,101 @@
+import time
+import zlib
+
+import pytest
+from pydantic import TypeAdapter
+
+from src.cache.codecs import (
+    FLAG_COMPRESSED,
+    FORMAT_VERSION,
+    HEADER,
+    CodecError,
+    JsonSerializer,
+    PydanticSerializer,
+    get_codec,
+)
+
+ADAPTER = TypeAdapter(dict[str, int])
+
+
+@pytest.mark.parametrize("name", ["pydantic", "json", "orjson", "msgpack"])
+def test_codec_roundtrip(name):
+    codec = get_codec(name, compress_threshold=16)
+
+    for data in ({"a": 1}, {str(number): number for number in range(100)}):
+        encoded = codec.dumps(data, fresh_for=60, delta=0.5)
+
+        assert codec.loads(encoded, ADAPTER) == data
+        metadata = codec.metadata(encoded)
+        assert metadata.fresh_until == pytest.approx(time.time() + 60, abs=1)
+        assert metadata.delta == pytest.approx(0.5)
+
+
+def test_codec_older_format_version():
+    codec = get_codec("pydantic")
+    payload = PydanticSerializer().dumps({"a": 1})
+    # Значение, записанное предыдущей версией формата
+    encoded = (
+        HEADER.pack(
+            FORMAT_VERSION - 1, PydanticSerializer.serializer_id, 0, 0.0, 0.0
+        )
+        + payload
+    )
+
+    with pytest.raises(CodecError):
+        codec.loads(encoded, ADAPTER)
+    with pytest.raises(CodecError):
+        codec.metadata(encoded)
+
+
+def test_codec_other_serializer():
+    encoded = get_codec("json").dumps({"a": 1})
+
+    with pytest.raises(CodecError):
+        get_codec("pydantic").loads(encoded, ADAPTER)
+
+
+def test_codec_truncated_header():
+    with pytest.raises(CodecError):
+        get_codec("pydantic").loads(b"{}", ADAPTER)
+
+
+def test_codec_compressed_flag():
+    encoded = get_codec("json", compress_threshold=1).dumps({"a": 1})
+    _, _, flags, _, _ = HEADER.unpack_from(encoded)
+
+    assert flags & FLAG_COMPRESSED
+    assert JsonSerializer().loads(
+        zlib.decompress(encoded[HEADER.size :]), ADAPTER
+    ) == {"a": 1}
+
+
+def test_codec_unknown():
+    with pytest.raises(ValueError):
+        get_codec("pickle")
+
+
+@pytest.mark.parametrize("name", ["pydantic", "json", "orjson", "msgpack"])
+def test_codec_corrupt_payload(name):
+    codec = get_codec(name)
+    encoded = codec.dumps({"a": 1})
+
+    with pytest.raises(CodecError):
+        codec.loads(encoded[: HEADER.size] + b"\xc1\xff{", ADAPTER)
+
+
+def test_codec_corrupt_compressed_payload():
+    codec = get_codec("json", compress_threshold=1)
+    encoded = codec.dumps({"a": 1})
+
+    with pytest.raises(CodecError):
+        codec.loads(encoded[:-4] + b"\x00\x00\x00\x00", ADAPTER)
+
+
+@pytest.mark.parametrize("name", ["pydantic", "json", "orjson", "msgpack"])
+def test_codec_schema_changed(name):
+    codec = get_codec(name)
+    # Значение, записанное до изменения схемы
+    encoded = codec.dumps({"a": "not a number"})
+
+    with pytest.raises(CodecError):
+        codec.loads(encoded, ADAPTER)
@@ -0,0 +1,86 @@
+import time
+
+from src.cache.memory import LocalCache
+
+
+def test_local_cache_evicts_by_bytes():
+    cache = LocalCache(max_entries=100, max_bytes=10)
+
+    cache.set("a", b"1234", expire=60)
+    cache.set("b", b"1234", expire=60)
+    # Обращение к "a" делает "b" самой давно использованной записью
+    assert cache.get("a") == b"1234"
+    cache.set("c", b"1234", expire=60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1234"
+    assert cache.get("c") == b"1234"
+    assert cache.stats()["bytes"] == 8
+    assert cache.evictions == 1
+
+
+def test_local_cache_evicts_several_for_large_value():
+    cache = LocalCache(max_entries=100, max_bytes=10)
+
+    for key in "abc":
+        cache.set(key, b"123", expire=60)
+    cache.set("d", b"12345678", expire=60)
+
+    assert [cache.get(key) for key in "abc"] == [None, None, None]
+    assert cache.get("d") == b"12345678"
+    assert cache.stats()["bytes"] == 8
+    assert cache.evictions == 3
+
+
+def test_local_cache_skips_value_over_max_bytes():
+    cache = LocalCache(max_entries=100, max_bytes=10)
+
+    cache.set("a", b"123", expire=60)
+    cache.set("b", b"12345678901", expire=60)
+
+    assert cache.get("a") == b"123"
+    assert cache.get("b") is None
+    assert cache.evictions == 0
+
+
+def test_local_cache_replaces_value_size():
+    cache = LocalCache(max_entries=100, max_bytes=10)
+
+    cache.set("a", b"12345678", expire=60)
+    cache.set("a", b"12", expire=60)
+    cache.set("b", b"12345678", expire=60)
+
+    assert cache.get("a") == b"12"
+    assert cache.stats()["bytes"] == 10
+    assert cache.evictions == 0
+
+
+def test_local_cache_evicts_by_entries():
+    cache = LocalCache(max_entries=2, max_bytes=100)
+
+    for key in "abc":
+        cache.set(key, b"1", expire=60)
+
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 2
+
+
+def test_local_cache_disabled():
+    cache = LocalCache(max_entries=0, max_bytes=100)
+
+    cache.set("a", b"1", expire=60)
+
+    assert cache.get("a") is None
+
+
+def test_local_cache_expires(monkeypatch):
+    cache = LocalCache(max_entries=10, max_bytes=100)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    cache.set("a", b"123", expire=5)
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 5)
+
+    assert cache.get("a") is None
+    assert cache.expirations == 1
+    assert cache.stats()["bytes"] == 0
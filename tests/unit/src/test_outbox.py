@@ -0,0 +1,121 @@
+import contextlib
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from src.api.services.outbox import OutboxRelay
+
+
+class FakeSession:
+    def __init__(self, events):
+        self.events = events
+        self.deleted = []
+        self.committed = False
+
+    async def execute(self, statement):
+        if statement.is_select:
+            return SimpleNamespace(
+                scalars=lambda: SimpleNamespace(all=lambda: self.events)
+            )
+        # Идентификаторы удаляемых событий из условия uuid IN (...)
+        self.deleted.extend(statement.whereclause.right.value)
+        return None
+
+    async def commit(self):
+        self.committed = True
+
+
+class FakeDatabase:
+    def __init__(self, events):
+        self.session = FakeSession(events)
+
+    @contextlib.asynccontextmanager
+    async def get_session(self):
+        yield self.session
+
+
+class FakePublisher:
+    def __init__(self, errors):
+        self.errors = errors
+        self.messages = []
+
+    async def publish_batch(self, messages):
+        self.messages.extend(messages)
+        return self.errors
+
+
+def make_events(count):
+    return [
+        SimpleNamespace(
+            uuid=uuid4(),
+            payload=b"{}",
+            routing_key="book.updated",
+            content_type="application/json",
+            exchange="books.events",
+        )
+        for _ in range(count)
+    ]
+
+
+def make_relay(database, publisher):
+    return OutboxRelay(
+        database, publisher, SimpleNamespace(batch_size=10, poll_interval=0.01)
+    )
+
+
+@pytest.mark.asyncio
+async def test_outbox_relay_deletes_confirmed():
+    events = make_events(3)
+    database = FakeDatabase(events)
+    publisher = FakePublisher([None, None, None])
+    relay = make_relay(database, publisher)
+
+    assert await relay.relay() == 3
+
+    assert [message.routing_key for message in publisher.messages] == [
+        "book.updated"
+    ] * 3
+    assert database.session.deleted == [event.uuid for event in events]
+    assert database.session.committed
+    assert relay.stats() == {"relayed": 3, "failed": 0}
+
+
+@pytest.mark.asyncio
+async def test_outbox_relay_keeps_not_confirmed():
+    events = make_events(3)
+    database = FakeDatabase(events)
+    publisher = FakePublisher([None, TimeoutError(), Exception("nack")])
+    relay = make_relay(database, publisher)
+
+    # Неподтверждённые события остаются в outbox до следующего раунда
+    assert await relay.relay() == 1
+
+    assert database.session.deleted == [events[0].uuid]
+    assert database.session.committed
+    assert relay.stats() == {"relayed": 1, "failed": 2}
+
+
+@pytest.mark.asyncio
+async def test_outbox_relay_none_confirmed():
+    events = make_events(2)
+    database = FakeDatabase(events)
+    publisher = FakePublisher([TimeoutError(), TimeoutError()])
+    relay = make_relay(database, publisher)
+
+    assert await relay.relay() == 0
+
+    assert database.session.deleted == []
+    assert relay.stats() == {"relayed": 0, "failed": 2}
+
+
+@pytest.mark.asyncio
+async def test_outbox_relay_empty():
+    database = FakeDatabase([])
+    publisher = FakePublisher([])
+    relay = make_relay(database, publisher)
+
+    assert await relay.relay() == 0
+
+    assert publisher.messages == []
+    assert relay.stats() == {"relayed": 0, "failed": 0}
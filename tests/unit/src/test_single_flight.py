@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from src.utils.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_single_flight_coalesces_calls():
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(
+        *(single_flight.do("key", load) for _ in range(10))
+    )
+
+    assert results == [1] * 10
+    assert calls == 1
+    assert len(single_flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_single_flight_leader_raises():
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise ConnectionError("database is down")
+
+    # Ошибка лидера получают все ожидающие его вызовы
+    results = await asyncio.gather(
+        *(single_flight.do("key", load) for _ in range(5)),
+        return_exceptions=True,
+    )
+
+    assert calls == 1
+    assert all(isinstance(result, ConnectionError) for result in results)
+    assert len(single_flight) == 0
+
+    # Следующий вызов выполняется заново, ошибка не запоминается
+    async def reload():
+        return "ok"
+
+    assert await single_flight.do("key", reload) == "ok"
+
+
+@pytest.mark.asyncio
+async def test_single_flight_caller_cancelled():
+    single_flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def load():
+        started.set()
+        await asyncio.sleep(0.01)
+        return "value"
+
+    first = asyncio.create_task(single_flight.do("key", load))
+    await started.wait()
+    second = asyncio.create_task(single_flight.do("key", load))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    # Отмена одного из вызовов не отменяет общий
+    assert await second == "value"
+    with pytest.raises(asyncio.CancelledError):
+        await first
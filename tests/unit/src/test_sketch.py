@@ -0,0 +1,59 @@
+from src.utils.sketch import FrequencySketch
+
+
+def test_sketch_estimates_frequencies():
+    sketch = FrequencySketch(width=1024, depth=4, top_k=10)
+
+    for number in range(10):
+        for _ in range(number):
+            sketch.add(f"key-{number}")
+
+    # Count-min никогда не занижает частоту
+    for number in range(10):
+        assert sketch.estimate(f"key-{number}") >= number
+    assert sketch.estimate("unknown") == 0
+
+
+def test_sketch_add_returns_estimate():
+    sketch = FrequencySketch(width=1024, depth=4, top_k=10)
+
+    assert [sketch.add("key") for _ in range(3)] == [1, 2, 3]
+
+
+def test_sketch_top_k():
+    sketch = FrequencySketch(width=1024, depth=4, top_k=3)
+
+    for number in range(6):
+        for _ in range(number + 1):
+            sketch.add(f"key-{number}")
+
+    assert sketch.top() == ["key-5", "key-4", "key-3"]
+
+
+def test_sketch_top_k_disabled():
+    sketch = FrequencySketch(width=1024, depth=4, top_k=0)
+
+    sketch.add("key")
+
+    assert sketch.top() == []
+
+
+def test_sketch_ages_counters():
+    sketch = FrequencySketch(width=32, depth=4, top_k=10)
+
+    for _ in range(200):
+        sketch.add("old")
+    # После width * 10 добавлений все счётчики делятся пополам
+    for _ in range(120):
+        sketch.add("new")
+
+    assert sketch.estimate("old") == 100
+    assert sketch.estimate("new") == 60
+    assert sketch.top() == ["old", "new"]
+
+    for _ in range(640):
+        sketch.add("new")
+
+    # Ключ, который перестали запрашивать, уступает начало топа
+    assert sketch.estimate("old") == 25
+    assert sketch.top() == ["new", "old"]
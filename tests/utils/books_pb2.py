@@ -18,8 +18,16 @@ _runtime_version.ValidateProtobufRuntimeVersion(
 _sym_db = _symbol_database.Default()
 
 
+from google.protobuf import (
+    field_mask_pb2 as google_dot_protobuf_dot_field__mask__pb2,
+)
+from google.protobuf import (
+    timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2,
+)
+
+
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n\x0b\x62ooks.proto\x12\x05\x62ooks"\x1d\n\rBookIdRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t"S\n\x0c\x42ookResponse\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x0e\n\x06\x61uthor\x18\x03 \x01(\t\x12\x16\n\x0epublished_date\x18\x04 \x01(\t"7\n\x11\x42ooksListResponse\x12"\n\x05\x62ooks\x18\x01 \x03(\x0b\x32\x13.books.BookResponse"\x07\n\x05\x45mpty2~\n\x0b\x42ookService\x12\x38\n\x0bGetBookById\x12\x14.books.BookIdRequest\x1a\x13.books.BookResponse\x12\x35\n\x0bGetAllBooks\x12\x0c.books.Empty\x1a\x18.books.BooksListResponseb\x06proto3'
+    b'\n\x0b\x62ooks.proto\x12\x05\x62ooks\x1a google/protobuf/field_mask.proto\x1a\x1fgoogle/protobuf/timestamp.proto"L\n\rBookIdRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12-\n\tread_mask\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMask"\xe9\x01\n\x0c\x42ookResponse\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x0e\n\x06\x61uthor\x18\x03 \x01(\t\x12\x1a\n\x0epublished_date\x18\x04 \x01(\tB\x02\x18\x01\x12\x30\n\x0cpublished_at\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\ncreated_at\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp"7\n\x11\x42ooksListResponse\x12"\n\x05\x62ooks\x18\x01 \x03(\x0b\x32\x13.books.BookResponse"h\n\x10ListBooksRequest\x12\x11\n\tpage_size\x18\x01 \x01(\x05\x12\x12\n\npage_token\x18\x02 \x01(\t\x12-\n\tread_mask\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.FieldMask"T\n\x15ListBooksPageResponse\x12"\n\x05\x62ooks\x18\x01 \x03(\x0b\x32\x13.books.BookResponse\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t"T\n\x14\x42\x61tchGetBooksRequest\x12\r\n\x05uuids\x18\x01 \x03(\t\x12-\n\tread_mask\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.FieldMask"\x07\n\x05\x45mpty2\xcb\x02\n\x0b\x42ookService\x12\x38\n\x0bGetBookById\x12\x14.books.BookIdRequest\x1a\x13.books.BookResponse\x12\x35\n\x0bGetAllBooks\x12\x0c.books.Empty\x1a\x18.books.BooksListResponse\x12;\n\tListBooks\x12\x17.books.ListBooksRequest\x1a\x13.books.BookResponse0\x01\x12\x46\n\rListBooksPage\x12\x17.books.ListBooksRequest\x1a\x1c.books.ListBooksPageResponse\x12\x46\n\rBatchGetBooks\x12\x1b.books.BatchGetBooksRequest\x1a\x18.books.BooksListResponseb\x06proto3'
 )
 
 _globals = globals()
@@ -27,14 +35,26 @@ _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, "books_pb2", _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
     DESCRIPTOR._loaded_options = None
-    _globals["_BOOKIDREQUEST"]._serialized_start = 22
-    _globals["_BOOKIDREQUEST"]._serialized_end = 51
-    _globals["_BOOKRESPONSE"]._serialized_start = 53
-    _globals["_BOOKRESPONSE"]._serialized_end = 136
-    _globals["_BOOKSLISTRESPONSE"]._serialized_start = 138
-    _globals["_BOOKSLISTRESPONSE"]._serialized_end = 193
-    _globals["_EMPTY"]._serialized_start = 195
-    _globals["_EMPTY"]._serialized_end = 202
-    _globals["_BOOKSERVICE"]._serialized_start = 204
-    _globals["_BOOKSERVICE"]._serialized_end = 330
+    _globals["_BOOKRESPONSE"].fields_by_name[
+        "published_date"
+    ]._loaded_options = None
+    _globals["_BOOKRESPONSE"].fields_by_name[
+        "published_date"
+    ]._serialized_options = b"\030\001"
+    _globals["_BOOKIDREQUEST"]._serialized_start = 89
+    _globals["_BOOKIDREQUEST"]._serialized_end = 165
+    _globals["_BOOKRESPONSE"]._serialized_start = 168
+    _globals["_BOOKRESPONSE"]._serialized_end = 401
+    _globals["_BOOKSLISTRESPONSE"]._serialized_start = 403
+    _globals["_BOOKSLISTRESPONSE"]._serialized_end = 458
+    _globals["_LISTBOOKSREQUEST"]._serialized_start = 460
+    _globals["_LISTBOOKSREQUEST"]._serialized_end = 564
+    _globals["_LISTBOOKSPAGERESPONSE"]._serialized_start = 566
+    _globals["_LISTBOOKSPAGERESPONSE"]._serialized_end = 650
+    _globals["_BATCHGETBOOKSREQUEST"]._serialized_start = 652
+    _globals["_BATCHGETBOOKSREQUEST"]._serialized_end = 736
+    _globals["_EMPTY"]._serialized_start = 738
+    _globals["_EMPTY"]._serialized_end = 745
+    _globals["_BOOKSERVICE"]._serialized_start = 748
+    _globals["_BOOKSERVICE"]._serialized_end = 1079
 # @@protoc_insertion_point(module_scope)